@@ -1,5 +1,8 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import alpaca_trade_api as tradeapi
 from datetime import datetime, timedelta
@@ -7,6 +10,18 @@ from typing import Optional
 from .base_provider import BaseDataProvider
 
 
+def _make_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated REST calls reuse open TLS connections"""
+    session = requests.Session()
+    # Retry reads when a kept-alive connection was dropped by the server. Only GETs: order POSTs and
+    # DELETEs such as close_position create orders, so a retry after a timeout could trade twice
+    retries = Retry(total=2, backoff_factor=0.1, allowed_methods=frozenset({'GET'}))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=retries)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
 class AlpacaDataProvider(BaseDataProvider):
     """Alpaca data provider for crypto and stock data"""
 
@@ -20,6 +35,7 @@ class AlpacaDataProvider(BaseDataProvider):
             "APCA-API-KEY-ID": api_key,
             "APCA-API-SECRET-KEY": secret_key
         }
+        self.session = _make_session()
 
     def _is_crypto(self, ticker: str) -> bool:
         """Determine if ticker is cryptocurrency"""
@@ -81,41 +97,44 @@ class AlpacaDataProvider(BaseDataProvider):
             }
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             data = response.json()
 
             if 'bars' not in data or symbol not in data['bars']:
                 return pd.DataFrame()
 
-            # Convert to DataFrame
-            bars = data['bars'][symbol]
-            df = pd.DataFrame(bars)
+            return self._bars_to_frame(data['bars'][symbol])
 
-            if df.empty:
-                return df
+        except Exception as e:
+            print(f"Error fetching historical data for {ticker}: {e}")
+            return pd.DataFrame()
 
-            # Standardize column names
-            df.rename(columns={
-                'o': 'Open',
-                'h': 'High',
-                'l': 'Low',
-                'c': 'Close',
-                'v': 'Volume',
-                't': 'timestamp'
-            }, inplace=True)
+    def _bars_to_frame(self, bars: list) -> pd.DataFrame:
+        """Convert a list of Alpaca bar objects to a standardized OHLCV DataFrame"""
+        # Convert to DataFrame
+        df = pd.DataFrame(bars)
 
-            # Convert timestamp
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        if df.empty:
+            return df
 
-            # Drop unnecessary columns
-            df.drop(columns=['vw', 'n'], inplace=True, errors='ignore')
+        # Standardize column names
+        df.rename(columns={
+            'o': 'Open',
+            'h': 'High',
+            'l': 'Low',
+            'c': 'Close',
+            'v': 'Volume',
+            't': 'timestamp'
+        }, inplace=True)
 
-            return df
+        # Convert timestamp
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
 
-        except Exception as e:
-            print(f"Error fetching historical data for {ticker}: {e}")
-            return pd.DataFrame()
+        # Drop unnecessary columns
+        df.drop(columns=['vw', 'n'], inplace=True, errors='ignore')
+
+        return df
 
     def get_live_data(self, ticker: str, lookback_minutes: int = 100) -> pd.DataFrame:
         """Get recent live data for crypto"""
@@ -155,9 +174,9 @@ class AlpacaDataProvider(BaseDataProvider):
 
         try:
             if is_crypto:
-                response = requests.get(url, headers={"accept": "application/json"})
+                response = self.session.get(url, headers={"accept": "application/json"})
             else:
-                response = requests.get(url, headers=self.headers)
+                response = self.session.get(url, headers=self.headers)
 
             response.raise_for_status()
             data = response.json()
@@ -236,9 +255,9 @@ class AlpacaDataProvider(BaseDataProvider):
 
         try:
             if is_crypto:
-                response = requests.get(url, headers={"accept": "application/json"})
+                response = self.session.get(url, headers={"accept": "application/json"})
             else:
-                response = requests.get(url, headers=self.headers)
+                response = self.session.get(url, headers=self.headers)
 
             response.raise_for_status()
             data = response.json()
@@ -340,7 +359,7 @@ class AlpacaDataProvider(BaseDataProvider):
         params = {'symbols': symbol}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -383,6 +402,14 @@ class AlpacaBroker:
             "APCA-API-KEY-ID": api_key,
             "APCA-API-SECRET-KEY": secret_key
         }
+        self.session = _make_session()
+        # Workers for concurrent requests (snapshots, order cancels), sized to the session's connection pool
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='alpaca-broker')
+
+    def close(self):
+        """Shut down the request workers and close the pooled HTTP session"""
+        self._pool.shutdown(wait=True)
+        self.session.close()
 
     def get_account(self):
         """Get account information using alpaca_trade_api"""
@@ -446,7 +473,7 @@ class AlpacaBroker:
         # Try to get crypto positions (this will fail if crypto is not enabled)
         try:
             url = f"{self.base_url}/v2/positions"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             positions = response.json()
 
@@ -627,7 +654,7 @@ class AlpacaBroker:
         """Get all positions using direct API call"""
         try:
             url = f"{self.base_url}/v2/positions"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -642,7 +669,7 @@ class AlpacaBroker:
                 symbol = symbol.replace('/', '')
 
             url = f"{self.base_url}/v2/positions/{symbol}"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
 
             if response.status_code == 404:
                 # No position exists
@@ -670,11 +697,35 @@ class AlpacaBroker:
                 'unrealized_plpc': '0'
             }
 
+    def get_snapshot(self, symbols: list):
+        """Get account and positions for the given symbols in two concurrent calls, however many symbols"""
+        url = f"{self.base_url}/v2/positions"
+        # Both requests share the pooled session, so the snapshot costs one round-trip of latency
+        account_future = self._pool.submit(self.get_account_api)
+        response = self.session.get(url, headers=self.headers)
+        response.raise_for_status()
+        held = {position['symbol']: position for position in response.json()}
+        account = account_future.result()
+
+        positions = {}
+        for symbol in symbols:
+            # Alpaca reports crypto positions without the slash (BTC/USD -> BTCUSD)
+            positions[symbol] = held.get(symbol.replace('/', ''), {
+                'symbol': symbol,
+                'qty': '0',
+                'side': 'long',
+                'avg_entry_price': '0',
+                'market_value': '0',
+                'unrealized_pl': '0',
+                'unrealized_plpc': '0'
+            })
+        return account, positions
+
     def get_account_api(self):
         """Get account information using direct API call"""
         try:
             url = f"{self.base_url}/v2/account"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -689,7 +740,7 @@ class AlpacaBroker:
                 'period': period,
                 'timeframe': '1Min'
             }
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -705,7 +756,7 @@ class AlpacaBroker:
                 'limit': limit,
                 'direction': 'desc'
             }
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -723,7 +774,7 @@ class AlpacaBroker:
             params = {
                 'cancel_orders': str(cancel_orders).lower()
             }
-            response = requests.delete(url, headers=self.headers, params=params)
+            response = self.session.delete(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -737,7 +788,7 @@ class AlpacaBroker:
             params = {
                 'cancel_orders': str(cancel_orders).lower()
             }
-            response = requests.delete(url, headers=self.headers, params=params)
+            response = self.session.delete(url, headers=self.headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -748,13 +799,25 @@ class AlpacaBroker:
         """Cancel a specific order using direct API call"""
         try:
             url = f"{self.base_url}/v2/orders/{order_id}"
-            response = requests.delete(url, headers=self.headers)
+            response = self.session.delete(url, headers=self.headers)
+            if response.status_code in (404, 422):
+                # Unknown or no longer cancelable (already filled, canceled or expired)
+                return {'status': 'closed', 'id': order_id, 'error': response.text}
             response.raise_for_status()
+            # A successful cancel is 204 No Content; there is no order body to parse
+            if response.status_code == 204 or not response.content:
+                return {'status': 'canceled', 'id': order_id}
             return response.json()
         except Exception as e:
             print(f"Error canceling order {order_id}: {e}")
             return {'status': 'failed', 'error': str(e)}
 
+    def cancel_orders(self, order_ids: list) -> list:
+        """Cancel several orders concurrently over the pooled session (results in order_ids order)"""
+        # Alpaca has no bulk cancel by id (DELETE /v2/orders cancels every open order), so this is
+        # one DELETE per order on the broker's workers, each reusing a kept-alive connection
+        return list(self._pool.map(self.cancel_order, order_ids))
+
 
 class SimulatedBroker:
     """Simulated broker that uses live Alpaca data but manages local account"""
@@ -1055,12 +1118,13 @@ class SimulatedBroker:
 
     def cancel_order(self, order_id: str) -> dict:
         """Cancel a pending order"""
+        # Filled orders are removed from self.orders, so there is nothing left to cancel
         if order_id not in self.orders:
-            return {'status': 'failed', 'error': 'Order not found'}
+            return {'status': 'closed', 'order_id': order_id, 'error': 'Order not found'}
 
         order = self.orders[order_id]
         if order['status'] != 'pending':
-            return {'status': 'failed', 'error': 'Order is not pending'}
+            return {'status': 'closed', 'order_id': order_id, 'error': 'Order is not pending'}
 
         # Remove from pending orders
         del self.orders[order_id]
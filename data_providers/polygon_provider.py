@@ -1,5 +1,6 @@
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from typing import Optional
 from .base_provider import BaseDataProvider
@@ -13,6 +14,9 @@ class PolygonDataProvider(BaseDataProvider):
     def __init__(self, api_key: str):
         super().__init__(api_key)
         self.base_url = "https://api.polygon.io/v2/aggs/ticker"
+        # Pooled session so each poll reuses the open TLS connection instead of a fresh handshake
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
     
     def get_data(self,
                  ticker: str = 'C:EURUSD',
@@ -33,7 +37,7 @@ class PolygonDataProvider(BaseDataProvider):
         url = (f"{self.base_url}/{ticker}/range/1/{timespan}/{from_date}/{to_date}"
                f"?adjusted=true&sort=asc&limit={limit}&apiKey={self.api_key}")
 
-        response = requests.get(url)
+        response = self.session.get(url)
 
         if response.status_code != 200:
             raise Exception(f"API request failed with status code {response.status_code}: {response.text}")
@@ -110,7 +114,7 @@ class PolygonDataProvider(BaseDataProvider):
             url = (f"{self.base_url}/{test_ticker}/range/1/day/{yesterday}/{today}"
                    f"?adjusted=true&sort=asc&limit=5&apiKey={self.api_key}")
 
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
 
             # Check for authentication/authorization errors
             if response.status_code == 401:
@@ -0,0 +1,114 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from polygon import WebSocketClient
+from polygon.websocket.models import Market
+
+from .polygon_provider import PolygonDataProvider
+
+# Per-minute aggregate channel and WebSocket market for each REST ticker prefix
+STREAM_CHANNELS = {
+    'X:': ('XA', Market.Crypto),
+    'C:': ('CA', Market.Forex),
+}
+STOCK_CHANNEL = ('AM', Market.Stocks)
+
+# Same column order as BaseDataProvider.format_dataframe() gives Polygon aggregates over REST
+BAR_COLUMNS = ('Volume', 'Open', 'Close', 'High', 'Low', 'timestamp')
+
+
+class PolygonStreamingDataProvider(PolygonDataProvider):
+    """Polygon.io provider that serves live bars from a WebSocket-fed buffer
+
+    The first get_live_data() call for a ticker seeds its buffer over REST and subscribes
+    to Polygon's per-minute aggregate stream. A background thread appends each streamed bar,
+    so later calls read memory instead of making a round-trip. When no bar has arrived within
+    stale_after seconds (about one bar interval, so a dropped stream costs at most one missed bar),
+    the REST path is used and reseeds the buffer.
+    """
+
+    def __init__(self, api_key: str, buffer_size: int = 1440, stale_after: float = 65.0,
+                 on_bar: Optional[Callable] = None):
+        super().__init__(api_key)
+        self.buffer_size = buffer_size
+        self.stale_after = stale_after
+        self.on_bar = on_bar  # e.g. LiveTradingEngine.notify_new_data
+        self._lock = threading.Lock()
+        self._buffers = {}
+        self._last_bar_at = {}
+        self._clients = {}
+        self._stream_tickers = {}
+
+    def get_live_data(self, ticker: str = 'C:EURUSD') -> pd.DataFrame:
+        """Get current day data from the stream buffer, falling back to REST when it is stale"""
+        with self._lock:
+            buffer = self._buffers.get(ticker)
+            fresh = buffer is not None and time.monotonic() - self._last_bar_at[ticker] <= self.stale_after
+            if fresh:
+                rows = list(buffer)
+        if fresh:
+            df = pd.DataFrame.from_records(rows, columns=BAR_COLUMNS)
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+            return df
+
+        df = super().get_live_data(ticker)
+        self._seed_buffer(ticker, df)
+        self._subscribe(ticker)
+        return df
+
+    def _seed_buffer(self, ticker: str, df: pd.DataFrame):
+        """Replace a ticker's buffer with the bars from a REST response"""
+        if df.empty:
+            return  # Failed or empty fetch: leave the ticker stale so the next call retries REST
+        timestamps = df['timestamp'].to_numpy('datetime64[ms]').astype(np.int64)
+        rows = zip(df['Volume'].tolist(), df['Open'].tolist(), df['Close'].tolist(),
+                   df['High'].tolist(), df['Low'].tolist(), timestamps.tolist())
+        with self._lock:
+            self._buffers[ticker] = deque(rows, maxlen=self.buffer_size)
+            self._last_bar_at[ticker] = time.monotonic()
+
+    def _subscribe(self, ticker: str):
+        """Subscribe a ticker to its market's aggregate stream, starting that stream if needed"""
+        channel, market = STREAM_CHANNELS.get(ticker[:2], STOCK_CHANNEL)
+        symbol = ticker[2:] if ticker[:2] in STREAM_CHANNELS else ticker
+        if market != Market.Stocks:
+            # Polygon streams crypto/forex pairs as BTC-USD / EUR/USD
+            symbol = f"{symbol[:-3]}{'-' if market == Market.Crypto else '/'}{symbol[-3:]}"
+        subscription = f"{channel}.{symbol}"
+
+        with self._lock:
+            if subscription in self._stream_tickers:
+                return
+            self._stream_tickers[subscription] = ticker
+            client = self._clients.get(market)
+            if client is None:
+                client = WebSocketClient(api_key=self.api_key, market=market, subscriptions=[subscription])
+                self._clients[market] = client
+                threading.Thread(target=client.run, args=(self._handle_msgs,), daemon=True).start()
+                return
+        client.subscribe(subscription)
+
+    def _handle_msgs(self, msgs):
+        """Append streamed aggregates to their ticker's buffer (runs on the stream thread)"""
+        updated = False
+        with self._lock:
+            for msg in msgs:
+                # Crypto/forex aggregates carry the pair, stock aggregates the symbol
+                symbol = getattr(msg, 'pair', None) or getattr(msg, 'symbol', None)
+                ticker = self._stream_tickers.get(f"{getattr(msg, 'event_type', None)}.{symbol}")
+                buffer = self._buffers.get(ticker)
+                if buffer is None:
+                    continue
+                bar = (msg.volume, msg.open, msg.close, msg.high, msg.low, msg.start_timestamp)
+                if buffer and buffer[-1][-1] == bar[-1]:
+                    buffer[-1] = bar  # Revised bar for the same minute
+                else:
+                    buffer.append(bar)
+                self._last_bar_at[ticker] = time.monotonic()
+                updated = True
+        if updated and self.on_bar:
+            self.on_bar()
@@ -26,6 +26,7 @@ class IBBroker(EWrapper, EClient):
         self.account_event = threading.Event()
         self.order_status = {}
         self.order_fill_events = {}  # Track fill events per order
+        self.order_listeners = []  # Callbacks notified on every order status update
         self._positions_lock = threading.Lock()  # Thread safety for positions
 
     # IB API Callbacks
@@ -88,6 +89,27 @@ class IBBroker(EWrapper, EClient):
             if orderId in self.order_fill_events:
                 self.order_fill_events[orderId].set()
 
+        # Push the update to registered listeners
+        if self.order_listeners:
+            event = {'id': str(orderId), 'status': status, 'filled': filled, 'avg_fill_price': avgFillPrice}
+            for listener in list(self.order_listeners):
+                try:
+                    listener(event)
+                except Exception as e:
+                    # A failing listener must not take down the reader thread or starve the others
+                    print(f"IB order listener error for order {orderId}: {e}")
+
+    def on_order_update(self, callback):
+        """Register a callback for order status updates (called from the IB reader thread)"""
+        self.order_listeners.append(callback)
+
+    def remove_order_listener(self, callback):
+        """Unregister a callback added with on_order_update"""
+        try:
+            self.order_listeners.remove(callback)
+        except ValueError:
+            pass
+
     # Connection methods
     def connect_to_tws(self, host: str = '127.0.0.1', port: int = 7497, client_id: int = 1) -> bool:
         """
@@ -1,50 +1,330 @@
+import asyncio
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import time
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional, Callable, List
 from data_providers.base_provider import BaseDataProvider
-from datetime import datetime
+from dataclasses import dataclass
+import atexit
 import logging
+import logging.handlers
+import queue
+import sys
+
+# Setup logging once per process rather than per engine instance
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# While any engine is live, engine records are queued and written by a background listener so
+# logging never blocks a tick; they still reach the same handlers that propagation would use
+_log_queue = queue.SimpleQueue()
+_log_lock = threading.Lock()
+_log_listener = None
+_log_users = 0
+
+
+def _enqueue_record(record) -> bool:
+    """Logger filter: queue the record for the listener instead of emitting it inline"""
+    if _log_listener is None:
+        return True
+    record.msg = record.getMessage()  # Format now, while the args are still current
+    record.args = None
+    _log_queue.put(record)
+    return False
+
+
+class _PropagatingHandler(logging.Handler):
+    """Emit a dequeued record through the engine logger's handlers and its ancestors'"""
+
+    def emit(self, record):
+        logger.callHandlers(record)
+
+
+def _start_log_listener():
+    """Start the shared log listener for one more engine (the first engine starts its thread)"""
+    global _log_listener, _log_users
+    with _log_lock:
+        _log_users += 1
+        if _log_listener is None:
+            listener = logging.handlers.QueueListener(_log_queue, _PropagatingHandler())
+            listener.start()
+            _log_listener = listener
+
+
+def _stop_log_listener(force: bool = False):
+    """Release one engine's hold on the log listener, stopping it and flushing the queue with the last"""
+    global _log_listener, _log_users
+    with _log_lock:
+        _log_users = 0 if force else max(_log_users - 1, 0)
+        if _log_users or _log_listener is None:
+            return
+        listener, _log_listener = _log_listener, None  # New records are emitted inline from here
+        listener.stop()
+        # Records queued after the listener's stop sentinel are still written
+        while True:
+            try:
+                record = _log_queue.get_nowait()
+            except queue.Empty:
+                break
+            logger.callHandlers(record)
+
+
+logger.addFilter(_enqueue_record)
+atexit.register(_stop_log_listener, True)
+
+# Bars of history (as a multiple of the strategy lookback) recomputed ahead of new bars
+# for window-bounded strategies, so their rolling indicators are settled in the rows we keep
+SIGNAL_WARMUP_FACTOR = 2
+
+# Initial number of trades the columnar trade log holds before growing
+TRADE_LOG_CAPACITY = 1024
+
+# Most bars handed to a strategy per poll (or 4x its lookback if larger), so feeds that
+# return their whole history don't make signal generation grow with session length
+MAX_BAR_HISTORY = 10_000
+
+# Seconds a broker account/position response is reused before refetching
+BROKER_CACHE_TTL = 0.5
+
+# Order statuses (lowercased, Alpaca and IB spellings) after which an order is no longer pending
+CLOSED_ORDER_STATUSES = frozenset({
+    'filled', 'canceled', 'cancelled', 'apicancelled', 'expired', 'rejected', 'inactive', 'done_for_day'
+})
+
+# Order result statuses that mean the order has not (yet) filled, so no trade is recorded
+UNFILLED_RESULT_STATUSES = frozenset({'failed', 'pending'})
+
+# Trade log actions that open a position, and those that close one (all / long side only)
+OPEN_ACTIONS = frozenset({'buy_long', 'sell_short'})
+CLOSE_ACTIONS = frozenset({'close_position', 'close_long', 'close_short'})
+CLOSE_LONG_ACTIONS = frozenset({'close_position', 'close_long'})
+
+# Most seconds between position syncs on idle ticks (no signal and no pending orders); at the
+# default one-minute cadence every idle tick syncs, and any fill or order forces the next one to
+POSITION_SYNC_INTERVAL = 5.0
+
+# Status glyphs for console output, with ASCII fallbacks for non-UTF terminals (e.g. Windows cp1252)
+UNICODE_GLYPHS = {'buy': '🔵', 'sell': '🔴', 'check': '🔍', 'cancel': '🚫', 'expired': '⏰', 'arrow': '→'}
+ASCII_GLYPHS = {'buy': '[BUY]', 'sell': '[SELL]', 'check': '[CHECK]', 'cancel': '[CANCEL]', 'expired': '[EXPIRED]', 'arrow': '->'}
+
+# Terminal color codes and the single-line status template for quiet mode
+ANSI = {'green': '\033[92m', 'red': '\033[91m', 'yellow': '\033[93m', 'cyan': '\033[96m',
+        'reset': '\033[0m', 'bold': '\033[1m'}
+# Full stats block printed by _display_trading_stats
+STATS_SEPARATOR = "=" * 60
+STATS_TEMPLATE = (
+    "\n{separator}\n"
+    " LIVE TRADING STATS - Iteration {iteration} (Alpaca Data)\n"
+    "{separator}\n"
+    "Symbol: {symbol}\n"
+    "Position: {position_status}\n"
+    "Market Value: ${market_value:.2f}\n"
+    "Total Trades: {total_trades}\n"
+    "Win Rate: {win_rate:.1f}%\n"
+    "Account Equity: ${current_balance:.2f}\n"
+    "Portfolio Value: ${portfolio_value:.2f}\n"
+    "Total Return: ${total_return:.2f}\n"
+    "Unrealized P&L: ${unrealized_pnl:.2f}\n"
+    "Total P&L: ${total_pnl:.2f}\n"
+    "Percent Return: {percent_return:.2f}%\n"
+    "Timestamp: {timestamp}\n"
+    "{separator}\n"
+)
+
+QUIET_STATUS_TEMPLATE = (
+    "\r{cyan}[{timestamp}]{reset} "
+    "{bold}{symbol}{reset} "
+    "Price: {yellow}{current_price:.5f}{reset} | "
+    "Position: {bold}{position_status}{reset} "
+    "@ {avg_entry_price:.5f} | "
+    "Unrealized: {unrealized_color}{unrealized_pnl:+.2f}{reset} | "
+    "Realized: {realized_color}{realized_pnl:+.2f}{reset} | "
+    "Total: {pnl_color}{bold}{total_pnl:+.2f}{reset} | "
+    "Trades: {total_trades} "
+    "(W:{profitable_trades} L:{losing_trades})"
+)
+
+
+@dataclass(slots=True)
+class PositionSnapshot:
+    """Broker position for a symbol with its numeric fields parsed once"""
+    qty: float = 0.0
+    avg_entry_price: float = 0.0
+    market_value: float = 0.0
+    unrealized_pl: float = 0.0
+
+    @classmethod
+    def from_broker(cls, position: dict) -> 'PositionSnapshot':
+        """Build a snapshot from a broker position payload (values are often strings)"""
+        return cls(
+            qty=float(position.get('qty') or 0),
+            avg_entry_price=float(position.get('avg_entry_price') or 0),
+            market_value=float(position.get('market_value') or 0),
+            unrealized_pl=float(position.get('unrealized_pl') or 0)
+        )
+
+
+@dataclass(slots=True)
+class PendingOrder:
+    """Limit order placed by the engine and still awaiting a fill"""
+    symbol: str
+    side: str
+    quantity: float
+    limit_price: Optional[float]
+    order_type: str
 
 
 class LiveTradingEngine:
     """Live trading engine for executing strategies in real-time"""
-    
+
+    # Fixed attribute layout: slot access skips the per-instance __dict__ lookup on the hot loop
+    __slots__ = (
+        'data_provider', 'broker_interface', 'initial_balance', 'trading_mode', 'position_percentage',
+        'cache_ttl', '_broker_fn', 'logger', '_glyphs', '_rest_pool', '_process_fn',
+        'position', 'entry_price', 'realized_gains', 'running', 'current_balance', 'use_alpaca_data',
+        'quiet_mode', '_wake', '_trade_cols', '_trade_n', '_perf_cache', 'pending_orders',
+        'order_timestamps', '_signal_cache', '_signal_strategy', '_signal_names', '_signal_lookback',
+        '_signal_update', '_signal_bounded', '_signal_validate', '_signal_idx', '_account_cache', '_position_cache',
+        '_orders_by_symbol_side', '_expiry_heap', '_last_position_sync', '_min_qty', '_positions_dirty',
+        '_long_short_handlers', 'display_every', '_listening_broker', '_log_queued'
+    )
+
     def __init__(self,
                  data_provider: BaseDataProvider,
                  broker_interface: Optional[object] = None,
                  initial_balance: float = 10000,
                  trading_mode: str = "long_only",
-                 position_percentage: float = 100.0):
+                 position_percentage: float = 100.0,
+                 cache_ttl: float = BROKER_CACHE_TTL):
         self.data_provider = data_provider
-        self.broker_interface = broker_interface
         self.initial_balance = initial_balance
         self.trading_mode = trading_mode
         self.position_percentage = position_percentage / 100.0  # Convert to decimal
+        self.cache_ttl = cache_ttl
+        encoding = (getattr(sys.stdout, 'encoding', None) or '').lower()
+        self._glyphs = UNICODE_GLYPHS if encoding.startswith('utf') else ASCII_GLYPHS
+        self._rest_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="broker-rest")
+        # Trading mode is fixed for the engine's lifetime, so bind its signal handler once;
+        # any mode other than long_only trades long/short
+        self._process_fn = (self._process_long_only_signals if trading_mode == "long_only"
+                            else self._process_long_short_signals)
+        # Long/short action per (position sign, signal side)
+        self._long_short_handlers = {
+            (-1, 'buy'): self._reverse_short_to_long,
+            (0, 'buy'): self._open_long_from_flat,
+            (1, 'buy'): self._ignore_buy_while_long,
+            (1, 'sell'): self._reverse_long_to_short,
+            (0, 'sell'): self._open_short_from_flat,
+            (-1, 'sell'): self._ignore_sell_while_short
+        }
         self.reset()
+        # Bound after reset() so a pushed order update never finds the order tracking unset
+        self._listening_broker = None
+        self.set_broker_interface(broker_interface)
 
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        self._log_queued = False
+        self._queue_logging()
 
         # Debug: Log broker interface type
         if self.broker_interface:
-            broker_type = type(self.broker_interface).__name__
-            print(f"[DEBUG] LiveTradingEngine initialized with broker: {broker_type}")
+            self.logger.debug("LiveTradingEngine initialized with broker: %s", type(self.broker_interface).__name__)
     
     def reset(self):
         """Reset engine state"""
         self.position = 0  # 0 = no position, 1 = long, -1 = short
         self.entry_price = 0
         self.realized_gains = 0
-        self.trades = []
         self.running = False
         self.current_balance = self.initial_balance
         self.use_alpaca_data = True  # Flag to use only Alpaca data
         self.quiet_mode = False  # Set quiet mode flag
+        self.display_every = 1  # Show stats every Nth iteration
+        self._wake = threading.Event()  # Set by stop() to interrupt the wait between iterations
+
+        # Columnar trade log: one preallocated array per field plus a write cursor
+        self._trade_cols = {
+            'timestamp': np.empty(TRADE_LOG_CAPACITY, dtype=object),
+            'action': np.empty(TRADE_LOG_CAPACITY, dtype=object),
+            'price': np.empty(TRADE_LOG_CAPACITY, dtype=np.float64),
+            'quantity': np.empty(TRADE_LOG_CAPACITY, dtype=np.float64),
+            'order_details': np.empty(TRADE_LOG_CAPACITY, dtype=object)
+        }
+        self._trade_n = 0
+
+        # Trade statistics keyed on the trade count they were computed from
+        self._perf_cache = {'n_trades': -1, 'value': None}
 
         # Order tracking for limit orders
         self.pending_orders = {}  # Track pending limit orders by order_id
-        self.order_timestamps = {}  # Track order placement times
+        self.order_timestamps = {}  # Track order placement times (time.monotonic())
+        self._orders_by_symbol_side = {}  # (symbol, side) -> order ids, kept in placement order
+        self._expiry_heap = []  # (placed_at, order_id, symbol) min-heap; stale entries skipped lazily
+
+        # Broker responses as (monotonic fetch time, value); positions keyed by symbol
+        self._account_cache = None
+        self._position_cache = {}
+        self._positions_dirty = False  # Set after fills; broker positions refreshed once before the next read
+        self._last_position_sync = float('-inf')  # time.monotonic() of the last idle-tick sync
+
+        # Per-symbol (minimum quantity, whole units only), resolved on first sighting
+        self._min_qty = {}
+
+        # Signal DataFrame from the previous poll, extended with only the new bars
+        self._signal_cache = {'last_ts': None, 'df': None, 'strategy': None}
+
+        # Strategy signal metadata, resolved once per strategy
+        self._signal_strategy = None
+        self._signal_names = None
+        self._signal_lookback = None
+        self._signal_update = None
+        self._signal_bounded = False
+        self._signal_validate = None
+        self._signal_idx = None
+
+    @property
+    def trades(self) -> List[Dict]:
+        """Trade log as a list of dicts, built on demand from the columnar buffers"""
+        cols = self._trade_cols
+        return [
+            {name: col[i] for name, col in cols.items()}
+            for i in range(self._trade_n)
+        ]
+
+    def _record_trade(self, timestamp, action: str, price: float, quantity: float, order_details: dict):
+        """Append a trade to the columnar trade log, doubling the buffers when full"""
+        cols = self._trade_cols
+        n = self._trade_n
+        if n == len(cols['price']):
+            for name, col in cols.items():
+                grown = np.empty(2 * n, dtype=col.dtype)
+                grown[:n] = col
+                cols[name] = grown
+
+        cols['timestamp'][n] = timestamp
+        cols['action'][n] = action
+        cols['price'][n] = price
+        cols['quantity'][n] = quantity
+        cols['order_details'][n] = order_details
+        self._trade_n = n + 1
+
+    def _log_recorded_trade(self, timestamp, action: str, price: float, quantity: float, result: dict):
+        """Log the backend trade record at debug level (formatted only if debug logging is enabled)"""
+        self.logger.debug(
+            "[BACKEND] Trade recorded:\n"
+            "  Timestamp: %s\n"
+            "  Action: %s\n"
+            "  Price: $%.2f\n"
+            "  Fill Price: $%.2f\n"
+            "  Quantity: %s",
+            timestamp, action, price, result.get('avg_fill_price', 0), quantity
+        )
 
     def _print_trade_msg(self, message: str, quiet_alternative: str = None):
         """Print trade message with quiet mode support"""
@@ -55,34 +335,79 @@ class LiveTradingEngine:
     
     def set_broker_interface(self, broker_interface):
         """Set the broker interface for live trading"""
+        self._detach_order_listener()
         self.broker_interface = broker_interface
+
+        # Optional broker capabilities, probed once and bound (None when unsupported)
+        self._broker_fn = {
+            name: getattr(broker_interface, name, None)
+            for name in ('close_position', 'cancel_order', 'cancel_orders', 'get_position_for_symbol',
+                         'get_snapshot', 'check_pending_orders', 'refresh_positions')
+        }
+        self._broker_fn['get_account'] = (getattr(broker_interface, 'get_account_api', None)
+                                          or getattr(broker_interface, 'get_account', None))
+
+        self._attach_order_listener()
+
+    def _attach_order_listener(self):
+        """Let brokers that stream order updates push fills/cancels instead of waiting for a poll"""
+        broker = self.broker_interface
+        if self._listening_broker is broker:
+            return
+        self._detach_order_listener()
+        if hasattr(broker, 'on_order_update'):
+            broker.on_order_update(self._on_order_event)
+            self._listening_broker = broker
+
+    def _detach_order_listener(self):
+        """Unregister from the broker's order updates, so a reused broker does not keep calling this engine"""
+        broker = self._listening_broker
+        self._listening_broker = None
+        remove_listener = getattr(broker, 'remove_order_listener', None)
+        if remove_listener is not None:
+            remove_listener(self._on_order_event)
+
+    def _queue_logging(self):
+        """Hold the background log listener while this engine runs"""
+        if not self._log_queued:
+            self._log_queued = True
+            _start_log_listener()
+
+    def _unqueue_logging(self):
+        """Release this engine's hold on the log listener (flushing it if no other engine holds it)"""
+        if self._log_queued:
+            self._log_queued = False
+            _stop_log_listener()
+
+    def _on_order_event(self, event: dict):
+        """Handle a pushed order status update from the broker"""
+        status = str(event.get('status', '')).lower()
+        if status in CLOSED_ORDER_STATUSES:
+            self._untrack_pending_order(event.get('id'))
+        if status in CLOSED_ORDER_STATUSES or status == 'partially_filled':
+            self._invalidate_broker_cache()
     
     def execute_buy_order(self, symbol: str, quantity: float = 1, order_type: str = "market", limit_price: float = None, current_price: float = None) -> dict:
         """Execute buy order and return order details"""
         try:
-            # Debug logging
-            if self.broker_interface:
-                broker_type = type(self.broker_interface).__name__
-                print(f"[DEBUG] Broker Interface: {broker_type}")
-                print(f"[DEBUG] Executing BUY via {broker_type}")
-
             if self.broker_interface:
+                self.logger.debug("Executing BUY via %s", type(self.broker_interface).__name__)
                 if order_type == "limit" and limit_price is not None:
                     # For limit orders, pass the limit price to the broker interface
                     result = self.broker_interface.buy(symbol, quantity, order_type="limit", limit_price=limit_price, current_price=current_price)
                 else:
                     result = self.broker_interface.buy(symbol, quantity, order_type=order_type, current_price=current_price)
+                self._invalidate_broker_cache()
 
                 # Track pending limit orders
                 if order_type == "limit" and isinstance(result, dict) and 'id' in result:
-                    self.pending_orders[result['id']] = {
-                        'symbol': symbol,
-                        'side': 'buy',
-                        'quantity': quantity,
-                        'limit_price': limit_price,
-                        'order_type': order_type
-                    }
-                    self.order_timestamps[result['id']] = datetime.now()
+                    self._track_pending_order(result['id'], PendingOrder(
+                        symbol=symbol,
+                        side='buy',
+                        quantity=quantity,
+                        limit_price=limit_price,
+                        order_type=order_type
+                    ))
 
                 return result if isinstance(result, dict) else {'status': 'executed', 'details': result}
             else:
@@ -93,29 +418,24 @@ class LiveTradingEngine:
     def execute_sell_order(self, symbol: str, quantity: float = 1, order_type: str = "market", limit_price: float = None, current_price: float = None) -> dict:
         """Execute sell order and return order details"""
         try:
-            # Debug logging
-            if self.broker_interface:
-                broker_type = type(self.broker_interface).__name__
-                print(f"[DEBUG] Broker Interface: {broker_type}")
-                print(f"[DEBUG] Executing SELL via {broker_type}")
-
             if self.broker_interface:
+                self.logger.debug("Executing SELL via %s", type(self.broker_interface).__name__)
                 if order_type == "limit" and limit_price is not None:
                     # For limit orders, pass the limit price to the broker interface
                     result = self.broker_interface.sell(symbol, quantity, order_type="limit", limit_price=limit_price, current_price=current_price)
                 else:
                     result = self.broker_interface.sell(symbol, quantity, order_type=order_type, current_price=current_price)
+                self._invalidate_broker_cache()
 
                 # Track pending limit orders
                 if order_type == "limit" and isinstance(result, dict) and 'id' in result:
-                    self.pending_orders[result['id']] = {
-                        'symbol': symbol,
-                        'side': 'sell',
-                        'quantity': quantity,
-                        'limit_price': limit_price,
-                        'order_type': order_type
-                    }
-                    self.order_timestamps[result['id']] = datetime.now()
+                    self._track_pending_order(result['id'], PendingOrder(
+                        symbol=symbol,
+                        side='sell',
+                        quantity=quantity,
+                        limit_price=limit_price,
+                        order_type=order_type
+                    ))
 
                 return result if isinstance(result, dict) else {'status': 'executed', 'details': result}
             else:
@@ -126,162 +446,344 @@ class LiveTradingEngine:
     def close_position(self, symbol: str, current_price: float = None) -> dict:
         """Close position using Alpaca close position API - always use market orders"""
         try:
-            if self.broker_interface and hasattr(self.broker_interface, 'close_position'):
-                result = self.broker_interface.close_position(symbol, current_price=current_price)
+            broker_close = self._broker_fn['close_position']
+            if broker_close is not None:
+                result = broker_close(symbol, current_price=current_price)
+                self._invalidate_broker_cache()
                 return result if isinstance(result, dict) else {'status': 'executed', 'details': result}
             else:
                 return {'status': 'simulated', 'symbol': symbol, 'action': 'close_position'}
         except Exception as e:
             return {'status': 'failed', 'error': str(e)}
 
+    def _track_pending_order(self, order_id: str, order_info: PendingOrder):
+        """Start tracking a pending limit order"""
+        placed_at = time.monotonic()
+        self.pending_orders[order_id] = order_info
+        self.order_timestamps[order_id] = placed_at
+        heapq.heappush(self._expiry_heap, (placed_at, order_id, order_info.symbol))
+        key = (order_info.symbol, order_info.side)
+        self._orders_by_symbol_side.setdefault(key, {})[order_id] = None
+
+    def _untrack_pending_order(self, order_id: str):
+        """Stop tracking a pending limit order"""
+        order_info = self.pending_orders.pop(order_id, None)
+        self.order_timestamps.pop(order_id, None)
+        if order_info is not None:
+            key = (order_info.symbol, order_info.side)
+            order_ids = self._orders_by_symbol_side.get(key)
+            if order_ids is not None:
+                order_ids.pop(order_id, None)
+                if not order_ids:
+                    del self._orders_by_symbol_side[key]
+
+    def _has_pending_order(self, symbol: str, side: str) -> bool:
+        """Check whether a pending order exists for a symbol and side"""
+        return (symbol, side) in self._orders_by_symbol_side
+
     def cancel_order(self, order_id: str) -> dict:
         """Cancel a pending order"""
         try:
-            if self.broker_interface and hasattr(self.broker_interface, 'cancel_order'):
-                result = self.broker_interface.cancel_order(order_id)
-                # Remove from tracking
-                if order_id in self.pending_orders:
-                    del self.pending_orders[order_id]
-                if order_id in self.order_timestamps:
-                    del self.order_timestamps[order_id]
+            broker_cancel = self._broker_fn['cancel_order']
+            if broker_cancel is not None:
+                result = broker_cancel(order_id)
+                self._invalidate_broker_cache()
+                self._untrack_canceled_order(order_id, result)
                 return result
             else:
                 return {'status': 'simulated', 'order_id': order_id, 'action': 'cancel'}
         except Exception as e:
             return {'status': 'failed', 'error': str(e)}
 
+    def cancel_orders(self, order_ids: List[str]) -> List[dict]:
+        """Cancel several pending orders, in one request if the broker supports batch cancels"""
+        if not order_ids:
+            return []
+        broker_cancel_many = self._broker_fn['cancel_orders']
+        if broker_cancel_many is None:
+            return [self.cancel_order(order_id) for order_id in order_ids]
+
+        try:
+            results = broker_cancel_many(order_ids)
+            self._invalidate_broker_cache()
+        except Exception as e:
+            return [{'status': 'failed', 'error': str(e)} for _ in order_ids]
+
+        for order_id, result in zip(order_ids, results):
+            self._untrack_canceled_order(order_id, result)
+        return results
+
+    def _untrack_canceled_order(self, order_id: str, result):
+        """Stop tracking an order unless its cancel failed and it may still be open at the broker"""
+        if not (isinstance(result, dict) and result.get('status') == 'failed'):
+            self._untrack_pending_order(order_id)
+
     def check_and_cancel_expired_orders(self, symbol: str, timeout_minutes: int = 1):
         """Check for expired limit orders and cancel them"""
-        current_time = datetime.now()
+        cutoff = time.monotonic() - timeout_minutes * 60
         expired_orders = []
+        expired_entries = []
+        other_symbols = []
+
+        # Only orders placed before the cutoff can have expired - pop them off the heap
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= cutoff:
+            entry = heapq.heappop(heap)
+            order_id = entry[1]
+            if order_id not in self.pending_orders:
+                continue  # Already filled or canceled
+            if entry[2] == symbol:
+                expired_orders.append(order_id)
+                expired_entries.append(entry)
+            else:
+                other_symbols.append(entry)
 
-        for order_id, order_time in self.order_timestamps.items():
-            if order_id in self.pending_orders:
-                order_info = self.pending_orders[order_id]
-                if order_info['symbol'] == symbol:
-                    time_diff = (current_time - order_time).total_seconds() / 60
-                    if time_diff >= timeout_minutes:
-                        expired_orders.append(order_id)
+        # Expired orders for other symbols are left for their own check
+        for entry in other_symbols:
+            heapq.heappush(heap, entry)
 
         # Cancel expired orders
         for order_id in expired_orders:
-            order_info = self.pending_orders.get(order_id, {})
-            print(f"\n⏰ CANCELING EXPIRED ORDER - {order_info.get('side', 'unknown').upper()} order for {symbol} (expired after {timeout_minutes} minute(s))")
-            result = self.cancel_order(order_id)
-            if result.get('status') != 'failed':
-                print(f" ORDER CANCELED - Order ID: {order_id}")
+            order_info = self.pending_orders.get(order_id)
+            side = order_info.side if order_info is not None else 'unknown'
+            print(f"\n{self._glyphs['expired']} CANCELING EXPIRED ORDER - {side.upper()} order for {symbol} (expired after {timeout_minutes} minute(s))")
+
+        for entry, result in zip(expired_entries, self.cancel_orders(expired_orders)):
+            status = result.get('status')
+            if status == 'closed':
+                print(f" ORDER ALREADY CLOSED - Order ID: {entry[1]}")
+            elif status != 'failed':
+                print(f" ORDER CANCELED - Order ID: {entry[1]}")
             else:
                 print(f" CANCEL FAILED - {result.get('error', 'Unknown error')}")
+                # Still tracked, so keep it on the heap to retry the cancel on the next check
+                heapq.heappush(heap, entry)
 
         return len(expired_orders)
 
     def _cancel_pending_buy_orders(self, symbol: str):
         """Cancel all pending buy orders for a symbol"""
-        orders_to_cancel = []
-        for order_id, order_info in self.pending_orders.items():
-            if order_info['symbol'] == symbol and order_info['side'] == 'buy':
-                orders_to_cancel.append(order_id)
+        orders_to_cancel = list(self._orders_by_symbol_side.get((symbol, 'buy'), ()))
 
         for order_id in orders_to_cancel:
-            print(f"🚫 CANCELING PENDING BUY ORDER - Order ID: {order_id}")
-            self.cancel_order(order_id)
+            print(f"{self._glyphs['cancel']} CANCELING PENDING BUY ORDER - Order ID: {order_id}")
+        self.cancel_orders(orders_to_cancel)
 
     def _cancel_pending_sell_orders(self, symbol: str):
         """Cancel all pending sell orders for a symbol"""
-        orders_to_cancel = []
-        for order_id, order_info in self.pending_orders.items():
-            if order_info['symbol'] == symbol and order_info['side'] == 'sell':
-                orders_to_cancel.append(order_id)
+        orders_to_cancel = list(self._orders_by_symbol_side.get((symbol, 'sell'), ()))
 
         for order_id in orders_to_cancel:
-            print(f"🚫 CANCELING PENDING SELL ORDER - Order ID: {order_id}")
-            self.cancel_order(order_id)
+            print(f"{self._glyphs['cancel']} CANCELING PENDING SELL ORDER - Order ID: {order_id}")
+        self.cancel_orders(orders_to_cancel)
+
+    def get_alpaca_position(self, symbol: str) -> PositionSnapshot:
+        """Get current position from Alpaca API (reused for cache_ttl seconds)"""
+        cached = self._position_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
 
-    def get_alpaca_position(self, symbol: str) -> dict:
-        """Get current position from Alpaca API"""
         try:
-            if self.broker_interface and hasattr(self.broker_interface, 'get_position_for_symbol'):
-                return self.broker_interface.get_position_for_symbol(symbol)
-            return {'qty': '0', 'side': 'long', 'avg_entry_price': '0', 'market_value': '0', 'unrealized_pl': '0'}
+            if self._positions_dirty:
+                self._positions_dirty = False
+                if self._broker_fn['refresh_positions'] is not None:
+                    self._broker_fn['refresh_positions']()
+
+            broker_position = self._broker_fn['get_position_for_symbol']
+            if broker_position is not None:
+                position = broker_position(symbol)
+                if not isinstance(position, PositionSnapshot):
+                    position = PositionSnapshot.from_broker(position)
+                self._position_cache[symbol] = (time.monotonic(), position)
+                return position
+            return PositionSnapshot()
         except Exception as e:
             self.logger.error(f"Error getting Alpaca position: {e}")
-            return {'qty': '0', 'side': 'long', 'avg_entry_price': '0', 'market_value': '0', 'unrealized_pl': '0'}
+            return PositionSnapshot()
 
     def get_alpaca_account(self) -> dict:
-        """Get account information from Alpaca API"""
+        """Get account information from Alpaca API (reused for cache_ttl seconds)"""
+        cached = self._account_cache
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
         try:
-            if self.broker_interface and hasattr(self.broker_interface, 'get_account_api'):
-                return self.broker_interface.get_account_api()
-            elif self.broker_interface and hasattr(self.broker_interface, 'get_account'):
-                return self.broker_interface.get_account()
-            return {'equity': self.current_balance, 'buying_power': self.current_balance, 'portfolio_value': self.current_balance}
+            broker_account = self._broker_fn['get_account']
+            if broker_account is None:
+                return {'equity': self.current_balance, 'buying_power': self.current_balance, 'portfolio_value': self.current_balance}
+            account = broker_account()
+            self._account_cache = (time.monotonic(), account)
+            return account
         except Exception as e:
             self.logger.error(f"Error getting Alpaca account: {e}")
             return {'equity': self.current_balance, 'buying_power': self.current_balance, 'portfolio_value': self.current_balance}
 
-    def _validate_signals(self, df: pd.DataFrame, strategy) -> bool:
-        """Validate signals before executing trades (silent)"""
+    def _refresh_snapshot(self, symbol: str):
+        """Refresh the cached account and position from one consolidated broker call"""
+        now = time.monotonic()
+        cached_position = self._position_cache.get(symbol)
+        if (self._account_cache is not None and now - self._account_cache[0] < self.cache_ttl
+                and cached_position is not None and now - cached_position[0] < self.cache_ttl):
+            return
+
         try:
-            # Ensure we have enough data for reliable signals
-            if len(df) < strategy.get_required_lookback():
-                return False
+            account, positions = self._broker_fn['get_snapshot']([symbol])
+        except Exception as e:
+            self.logger.error(f"Error getting Alpaca snapshot: {e}")
+            return
 
-            # Get the latest few signals to check for consistency
-            signal_names = strategy.get_signal_names()
-            latest_row = df.iloc[-1]
-            buy_signal = latest_row[signal_names['buy']]
-            sell_signal = latest_row[signal_names['sell']]
+        now = time.monotonic()
+        self._account_cache = (now, account)
+        for position_symbol, position in positions.items():
+            self._position_cache[position_symbol] = (now, PositionSnapshot.from_broker(position))
 
-            # Check if signals are not conflicting (both buy and sell at same time)
-            if buy_signal and sell_signal:
-                return False
-
-            # Additional strategy-specific validations
-            if hasattr(strategy, 'validate_signal_conditions'):
-                if not strategy.validate_signal_conditions(df):
-                    return False
+    def _prefetch_broker_state(self, symbol: str):
+        """Warm the account and position caches ahead of a tick"""
+        if self._broker_fn['get_snapshot'] is not None:
+            self._refresh_snapshot(symbol)
+        else:
+            self.get_alpaca_account()
+            self.get_alpaca_position(symbol)
+
+    def _invalidate_broker_cache(self):
+        """Drop cached account/position responses after anything that changes them"""
+        self._account_cache = None
+        self._position_cache.clear()
+        self._last_position_sync = float('-inf')  # Next idle tick resyncs the position
+
+    def _get_signal_names(self, strategy) -> Dict[str, str]:
+        """Get strategy signal column names (and its optional hooks), looked up once per strategy"""
+        if self._signal_strategy is not strategy:
+            self._signal_strategy = strategy
+            self._signal_names = strategy.get_signal_names()
+            self._signal_lookback = strategy.get_required_lookback()
+            self._signal_update = getattr(strategy, 'update_signals', None)
+            self._signal_bounded = bool(getattr(strategy, 'window_bounded_signals', False))
+            self._signal_validate = getattr(strategy, 'validate_signal_conditions', None)
+            self._signal_idx = None
+        return self._signal_names
+
+    def _get_required_lookback(self, strategy) -> int:
+        """Get the strategy's required lookback, looked up once per strategy"""
+        self._get_signal_names(strategy)
+        return self._signal_lookback
+
+    def _get_signal_indices(self, df: pd.DataFrame, strategy) -> np.ndarray:
+        """Get positional indices of the buy/sell/Close/timestamp columns, re-resolved only if the layout changed"""
+        signal_names = self._get_signal_names(strategy)
+        names = [signal_names['buy'], signal_names['sell'], 'Close', 'timestamp']
+        idx = self._signal_idx
+        columns = df.columns
+        if idx is None or idx.max() >= len(columns) or list(columns[idx]) != names:
+            idx = columns.get_indexer(names)
+            self._signal_idx = idx
+        return idx
+
+    def _validate_signals(self, buy_signal, sell_signal, df: pd.DataFrame, strategy) -> bool:
+        """Validate the latest buy/sell signal values before executing trades (silent)"""
+        # Ensure we have enough data for reliable signals
+        if df.shape[0] < self._get_required_lookback(strategy):
+            return False
 
-            return True
+        # Latest signal values must be set
+        if pd.isna(buy_signal) or pd.isna(sell_signal):
+            return False
 
-        except Exception:
+        # Check if signals are not conflicting (both buy and sell at same time)
+        if buy_signal and sell_signal:
             return False
 
+        # Additional strategy-specific validations
+        if self._signal_validate is not None:
+            if not self._signal_validate(df):
+                return False
+
+        return True
+
     def _confirm_trade_execution(self, action: str, symbol: str, quantity: float,
-                               current_price: float, position_data: dict) -> bool:
+                               current_price: float, position_data: PositionSnapshot,
+                               account_info: Optional[dict] = None) -> bool:
         """Final confirmation before executing trades - verify sufficient funds"""
-        try:
-            # Get account info for buying power check
+        # Get account info for buying power check, unless the caller's is still current
+        if account_info is None:
             account_info = self.get_alpaca_account()
-            buying_power = float(account_info.get('buying_power', 0))
-            account_balance = float(account_info.get('equity', 0))
+        try:
+            buying_power = float(account_info.get('buying_power') or 0)
+            account_balance = float(account_info.get('equity') or 0)
+        except (TypeError, ValueError):
+            return False
 
-            # Prevent trading if account balance is zero or negative
-            if account_balance <= 0:
+        # Prevent trading if account balance is zero or negative
+        if account_balance <= 0:
+            return False
+
+        # For buy orders and sell orders (opening short), verify sufficient funds
+        if action in ('BUY', 'SELL'):
+            trade_value = quantity * current_price
+            # Check buying power (for margin accounts) or equity (for cash accounts)
+            available_funds = max(buying_power, account_balance)
+            if trade_value > available_funds:
+                print(f"     INSUFFICIENT FUNDS - Need ${trade_value:.2f}, Have ${available_funds:.2f}")
                 return False
 
-            # For buy orders, verify sufficient funds
-            if action in ['BUY']:
-                trade_value = quantity * current_price
-                # Check buying power (for margin accounts) or equity (for cash accounts)
-                available_funds = max(buying_power, account_balance)
-                if trade_value > available_funds:
-                    print(f"     INSUFFICIENT FUNDS - Need ${trade_value:.2f}, Have ${available_funds:.2f}")
-                    return False
-
-            # For sell orders (opening short), also verify sufficient funds
-            if action in ['SELL']:
-                trade_value = quantity * current_price
-                # Check buying power (for margin accounts) or equity (for cash accounts)
-                available_funds = max(buying_power, account_balance)
-                if trade_value > available_funds:
-                    print(f"     INSUFFICIENT FUNDS - Need ${trade_value:.2f}, Have ${available_funds:.2f}")
-                    return False
-
-            # For close orders, allow to proceed (closing doesn't require additional capital)
-            return True
-
-        except Exception:
-            return False
+        # For close orders, allow to proceed (closing doesn't require additional capital)
+        return True
+
+    def _generate_signals(self, df: pd.DataFrame, strategy) -> pd.DataFrame:
+        """Generate signals, only recomputing the bars that arrived since the last poll when the strategy allows it"""
+        self._get_signal_names(strategy)
+        cache = self._signal_cache
+        cached = cache['df']
+        last_ts = df['timestamp'].iat[-1]
+
+        df_with_signals = None
+        if cached is not None and cache['strategy'] is strategy and last_ts >= cache['last_ts']:
+            # Refresh the new bars plus the last cached bar, which may have still been forming
+            refresh = int((df['timestamp'] > cache['last_ts']).sum()) + 1
+            warmup = self._get_required_lookback(strategy) * SIGNAL_WARMUP_FACTOR
+
+            if self._signal_update is not None:
+                # Strategy can extend its own indicator state incrementally
+                df_with_signals = self._signal_update(df, cached)
+            elif self._signal_bounded and refresh + warmup < len(df):
+                # Only for strategies that declare window-bounded signals: EMA/MACD style
+                # indicators never settle within the warmup, so a tail splice would change them
+                tail = strategy.generate_signals(df.iloc[-(refresh + warmup):]).iloc[-refresh:]
+                keep = cached[cached['timestamp'] < tail['timestamp'].iat[0]]
+                df_with_signals = pd.concat([keep, tail]).iloc[-len(df):]
+
+                # Cache didn't cover the start of this frame - fall back to a full pass
+                if len(df_with_signals) != len(df):
+                    df_with_signals = None
+                else:
+                    df_with_signals.index = df.index
+
+        if df_with_signals is None:
+            df_with_signals = strategy.generate_signals(df)
+
+        cache['df'] = df_with_signals
+        cache['last_ts'] = last_ts
+        cache['strategy'] = strategy
+        return df_with_signals
+
+    def _get_min_quantity(self, symbol: str):
+        """Get (minimum quantity, whole units only) for a symbol, cached per symbol"""
+        rule = self._min_qty.get(symbol)
+        if rule is None:
+            if '/' in symbol:  # Crypto
+                rule = (0.001, False)  # Minimum crypto quantity, fractional allowed
+            else:  # Stock
+                rule = (1, True)  # Minimum 1 share for stocks
+            self._min_qty[symbol] = rule
+        return rule
+
+    def _post_trade_equity(self, account_balance: float, result: dict, quantity: float,
+                           current_price: float, side: int) -> float:
+        """Estimate account equity after a market fill (side: 1 = bought, -1 = sold)"""
+        # A fill only moves equity by the difference between fill and mark price;
+        # the next iteration's account fetch reconciles any fees or slippage
+        fill_price = float(result.get('avg_fill_price') or current_price)
+        return account_balance + (current_price - fill_price) * abs(quantity) * side
 
     def process_signals(self,
                        df: pd.DataFrame,
@@ -291,41 +793,48 @@ class LiveTradingEngine:
         """Process trading signals from strategy"""
         if len(df) == 0:
             return
-        
-        # Get signals from strategy
-        df_with_signals = strategy.generate_signals(df)
-        signal_names = strategy.get_signal_names()
-        
-        # Get latest signals
-        latest_row = df_with_signals.iloc[-1]
-        buy_signal = latest_row[signal_names['buy']]
-        sell_signal = latest_row[signal_names['sell']]
-        
-        current_price = latest_row['Close']
-        timestamp = latest_row['timestamp']
 
-        # Calculate quantity based on position percentage if not provided
-        if quantity is None:
-            account_info = self.get_alpaca_account()
-            account_balance = float(account_info.get('equity', self.initial_balance))
+        # Bound the history the strategy scans; a positional slice is a view, not a copy
+        max_bars = max(self._get_required_lookback(strategy) * 4, MAX_BAR_HISTORY)
+        if len(df) > max_bars:
+            df = df.iloc[-max_bars:]
 
-            # Prevent trading if account balance is zero or negative
-            if account_balance <= 0:
-                return
+        # Get signals from strategy
+        df_with_signals = self._generate_signals(df, strategy)
+        buy_idx, sell_idx, close_idx, ts_idx = self._get_signal_indices(df_with_signals, strategy)
+        if min(buy_idx, sell_idx, close_idx, ts_idx) < 0:
+            raise KeyError(f"Missing signal columns in strategy output: {list(df_with_signals.columns)}")
 
-            trade_amount = account_balance * self.position_percentage
-            quantity = trade_amount / current_price
+        # Get latest signals
+        buy_signal = df_with_signals.iat[-1, buy_idx]
+        sell_signal = df_with_signals.iat[-1, sell_idx]
+
+        current_price = df_with_signals.iat[-1, close_idx]
+        timestamp = df_with_signals.iat[-1, ts_idx]
+
+        # Idle tick: nothing to trade and no orders to check, so skip the broker round-trips
+        # and only resync the position after a fill/order or periodically to pick up manual changes
+        if not (buy_signal or sell_signal) and not self.pending_orders:
+            now = time.monotonic()
+            if now - self._last_position_sync >= POSITION_SYNC_INTERVAL:
+                self._last_position_sync = now
+                if self._validate_signals(buy_signal, sell_signal, df_with_signals, strategy):
+                    self._sync_position(self.get_alpaca_position(symbol), False)
+            return
 
-            # Ensure minimum quantity for the asset type
-            if '/' in symbol:  # Crypto
-                quantity = max(0.001, quantity)  # Minimum crypto quantity
-            else:  # Stock
-                quantity = max(1, int(quantity))  # Minimum 1 share for stocks
+        # Fetch the account in the background so its round-trip overlaps the position fetch,
+        # unless the broker returns both from one consolidated snapshot call
+        use_snapshot = self._broker_fn['get_snapshot'] is not None
+        account_future = None
+        if quantity is None and not use_snapshot:
+            account_future = self._rest_pool.submit(self.get_alpaca_account)
 
         # Check for pending limit order fills (for SimulatedBroker)
-        if hasattr(self.broker_interface, 'check_pending_orders'):
-            filled_orders = self.broker_interface.check_pending_orders()
+        check_pending_orders = self._broker_fn['check_pending_orders']
+        if check_pending_orders is not None:
+            filled_orders = check_pending_orders()
             if filled_orders > 0:
+                self._invalidate_broker_cache()
                 print(f"{filled_orders} limit order(s) filled")
 
         # Check for expired orders and cancel them (for long-only mode: 1 minute timeout)
@@ -333,129 +842,138 @@ class LiveTradingEngine:
             self.check_and_cancel_expired_orders(symbol, timeout_minutes=1)
 
         # Get current position from broker (IB or Alpaca)
+        if use_snapshot:
+            self._refresh_snapshot(symbol)
         alpaca_position = self.get_alpaca_position(symbol)
-        current_qty = float(alpaca_position['qty'])
+        current_qty = alpaca_position.qty
+
+        # Calculate quantity based on position percentage if not provided
+        account_info = None
+        if quantity is None:
+            account_info = account_future.result() if account_future is not None else self.get_alpaca_account()
+            account_balance = float(account_info.get('equity', self.initial_balance))
+
+            # Prevent trading if account balance is zero or negative
+            if account_balance <= 0:
+                return
+
+            trade_amount = account_balance * self.position_percentage
+            quantity = trade_amount / current_price
+
+            # Ensure minimum quantity for the asset type
+            min_qty, whole_units = self._get_min_quantity(symbol)
+            quantity = max(min_qty, int(quantity) if whole_units else quantity)
 
         # ALWAYS log position check for debugging
         if buy_signal or sell_signal:
-            print(f"\n🔍 POSITION CHECK:")
-            print(f"     Symbol: {symbol}")
-            print(f"     Current Position: {current_qty}")
-            print(f"     Buy Signal: {buy_signal}")
-            print(f"     Sell Signal: {sell_signal}")
-            print(f"     Current Price: ${current_price:.5f}")
+            lines = [
+                f"\n{self._glyphs['check']} POSITION CHECK:",
+                f"     Symbol: {symbol}",
+                f"     Current Position: {current_qty}",
+                f"     Buy Signal: {buy_signal}",
+                f"     Sell Signal: {sell_signal}",
+                f"     Current Price: ${current_price:.5f}"
+            ]
 
             # Check for pending orders
             if self.pending_orders:
-                print(f"     Pending Orders: {len(self.pending_orders)}")
-                for order_id, order_info in self.pending_orders.items():
-                    if order_info['symbol'] == symbol:
-                        print(f"       - {order_info['side'].upper()} order pending")
-
-        # Debug output for signal detection (only in non-quiet mode)
-        if (buy_signal or sell_signal) and not getattr(self, 'quiet_mode', False):
-            print(f"\n SIGNAL DETECTED:")
-            print(f"     Buy Signal: {buy_signal}")
-            print(f"     Sell Signal: {sell_signal}")
-            print(f"     Current Position: {current_qty} {symbol}")
-            print(f"     Current Price: ${current_price:.2f}")
+                lines.append(f"     Pending Orders: {len(self.pending_orders)}")
+                for order_info in list(self.pending_orders.values()):
+                    if order_info.symbol == symbol:
+                        lines.append(f"       - {order_info.side.upper()} order pending")
+
+            # Debug output for signal detection (only in non-quiet mode)
+            if not self.quiet_mode:
+                lines += [
+                    f"\n SIGNAL DETECTED:",
+                    f"     Buy Signal: {buy_signal}",
+                    f"     Sell Signal: {sell_signal}",
+                    f"     Current Position: {current_qty} {symbol}",
+                    f"     Current Price: ${current_price:.2f}"
+                ]
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Validate signals before acting
-        signals_valid = self._validate_signals(df_with_signals, strategy)
+        signaled = bool(buy_signal or sell_signal)
+        signals_valid = self._validate_signals(buy_signal, sell_signal, df_with_signals, strategy)
         if not signals_valid:
-            if buy_signal or sell_signal:
+            if signaled:
                 print(f"     SIGNAL VALIDATION FAILED - Signal rejected")
             return
 
-        # Process signals based on trading mode
-        if self.trading_mode == "long_only":
-            self._process_long_only_signals(buy_signal, sell_signal, current_qty, alpaca_position,
-                                          symbol, quantity, current_price, timestamp)
-        else:  # long_short mode
-            self._process_long_short_signals(buy_signal, sell_signal, current_qty, alpaca_position,
-                                           symbol, quantity, current_price, timestamp)
+        # Process signals based on trading mode; with no signal (the common case) the handlers
+        # would only fetch the account, so skip straight to the position sync
+        if signaled:
+            if account_info is None:
+                account_info = self.get_alpaca_account()
+            self._process_fn(buy_signal, sell_signal, current_qty, alpaca_position, account_info,
+                             symbol, quantity, current_price, timestamp)
+
+        self._sync_position(alpaca_position, signaled)
 
-        # Update position info from Alpaca - ensure sync after manual changes
+    def _sync_position(self, alpaca_position: PositionSnapshot, signaled: bool):
+        """Update position info from Alpaca - ensure sync after manual changes"""
+        current_qty = alpaca_position.qty
         previous_position = self.position
         if current_qty > 0:
             self.position = 1
-            self.entry_price = float(alpaca_position['avg_entry_price'])
+            self.entry_price = alpaca_position.avg_entry_price
         elif current_qty < 0:
             self.position = -1
-            self.entry_price = float(alpaca_position['avg_entry_price'])
+            self.entry_price = alpaca_position.avg_entry_price
         else:
             self.position = 0
             self.entry_price = 0
 
         # Debug output if position changed without engine action (manual closure)
-        if previous_position != self.position and not (buy_signal or sell_signal):
+        if previous_position != self.position and not signaled:
             print(f"\nPOSITION SYNC - Position changed externally")
-            print(f"     Previous: {previous_position} → Current: {self.position}")
+            print(f"     Previous: {previous_position} {self._glyphs['arrow']} Current: {self.position}")
             print(f"     Alpaca Qty: {current_qty}")
             if self.position == 0 and previous_position != 0:
                 print(f"     Position was manually closed - ready for new signals")
 
-    def _process_long_only_signals(self, buy_signal, sell_signal, current_qty, alpaca_position,
+    def _process_long_only_signals(self, buy_signal, sell_signal, current_qty, alpaca_position, account_info,
                                  symbol, quantity, current_price, timestamp):
         """Process signals for long-only trading mode"""
-        # Get account info for display
-        account_info = self.get_alpaca_account()
+        # Account info for display
         account_balance = float(account_info.get('equity', 0))
-        unrealized_pnl = float(alpaca_position.get('unrealized_pl', 0))
+        unrealized_pnl = alpaca_position.unrealized_pl
         session_pnl = account_balance - self.initial_balance
 
         # Check for pending orders for this symbol
-        has_pending_buy = any(
-            order['symbol'] == symbol and order['side'] == 'buy'
-            for order in self.pending_orders.values()
-        )
-        has_pending_sell = any(
-            order['symbol'] == symbol and order['side'] == 'sell'
-            for order in self.pending_orders.values()
-        )
+        has_pending_buy = self._has_pending_order(symbol, 'buy')
+        has_pending_sell = self._has_pending_order(symbol, 'sell')
 
         # Process buy signal - only buy if NO position exists AND no pending buy orders
         if buy_signal and current_qty == 0 and not has_pending_buy:
-            if not getattr(self, 'quiet_mode', False):
-                print(f"\n🔵 BUY SIGNAL - Attempting to buy {quantity} {symbol} at ${current_price:.2f}")
+            if not self.quiet_mode:
+                print(f"\n{self._glyphs['buy']} BUY SIGNAL - Attempting to buy {quantity} {symbol} at ${current_price:.2f}")
                 print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
 
             # Final trade confirmation (silent)
-            if self._confirm_trade_execution('BUY', symbol, quantity, current_price, alpaca_position):
+            if self._confirm_trade_execution('BUY', symbol, quantity, current_price, alpaca_position, account_info):
                 # Open long position with MARKET order for reliable execution
                 result = self.execute_buy_order(symbol, quantity, order_type="market", current_price=current_price)
-                if result.get('status') not in ['failed', 'pending']:
-                    # Force position refresh for IB broker
-                    if hasattr(self.broker_interface, 'refresh_positions'):
-                        self.broker_interface.refresh_positions()
-
-                    # Get updated account info after trade
-                    updated_account = self.get_alpaca_account()
-                    updated_balance = float(updated_account.get('equity', account_balance))
+                if result.get('status') not in UNFILLED_RESULT_STATUSES:
+                    # Broker positions are refreshed on the next position read (for IB broker)
+                    self._positions_dirty = True
+
+                    updated_balance = self._post_trade_equity(account_balance, result, quantity, current_price, 1)
                     updated_session_pnl = updated_balance - self.initial_balance
 
-                    if not getattr(self, 'quiet_mode', False):
+                    if not self.quiet_mode:
                         print(f" BUY ORDER FILLED - {quantity} {symbol} at market")
                         print(f"     Fill Price: ${result.get('avg_fill_price', current_price):.5f}")
                         print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
                     else:
                         print(f"\n[BUY] {quantity} {symbol} @ ${result.get('avg_fill_price', current_price):.5f}")
 
-                    self.trades.append({
-                        'timestamp': timestamp,
-                        'action': 'buy_long',
-                        'price': current_price,
-                        'quantity': quantity,
-                        'order_details': result
-                    })
+                    self._record_trade(timestamp, 'buy_long', current_price, quantity, result)
 
                     # DEBUG: Backend trade logging
-                    print(f"\n[BACKEND] Trade recorded:")
-                    print(f"  Timestamp: {timestamp}")
-                    print(f"  Action: buy_long")
-                    print(f"  Price: ${current_price:.2f}")
-                    print(f"  Fill Price: ${result.get('avg_fill_price', 0):.2f}")
-                    print(f"  Quantity: {quantity}")
+                    self._log_recorded_trade(timestamp, 'buy_long', current_price, quantity, result)
                 else:
                     print(f" BUY ORDER FAILED - {result.get('error', 'Unknown error')}")
             else:
@@ -464,304 +982,231 @@ class LiveTradingEngine:
         # Debug output when buy signal is ignored
         elif buy_signal:
             if current_qty != 0:
-                print(f"\n🔵 BUY SIGNAL IGNORED - Already have position: {current_qty} {symbol}")
+                print(f"\n{self._glyphs['buy']} BUY SIGNAL IGNORED - Already have position: {current_qty} {symbol}")
                 print(f"     Cannot add to existing position (position limit enforced)")
-                if not getattr(self, 'quiet_mode', False):
-                    print(f"     Current Position Value: ${float(alpaca_position.get('market_value', 0)):.2f}")
+                if not self.quiet_mode:
+                    print(f"     Current Position Value: ${alpaca_position.market_value:.2f}")
                     print(f"     Unrealized P&L: ${unrealized_pnl:.2f}")
             elif has_pending_buy:
-                print(f"\n🔵 BUY SIGNAL IGNORED - Already have pending BUY order for {symbol}")
+                print(f"\n{self._glyphs['buy']} BUY SIGNAL IGNORED - Already have pending BUY order for {symbol}")
                 print(f"     Cannot place multiple buy orders (position limit enforced)")
 
         # Process sell signal - close position if it exists
         elif sell_signal and current_qty > 0:
-            if not getattr(self, 'quiet_mode', False):
-                print(f"\n🔴 SELL SIGNAL - Attempting to close position for {symbol} at ${current_price:.2f}")
+            if not self.quiet_mode:
+                print(f"\n{self._glyphs['sell']} SELL SIGNAL - Attempting to close position for {symbol} at ${current_price:.2f}")
                 print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
 
             # Close the existing long position
             result = self.close_position(symbol, current_price=current_price)
-            if result.get('status') not in ['failed', 'pending']:
-                # Force position refresh for IB broker
-                if hasattr(self.broker_interface, 'refresh_positions'):
-                    self.broker_interface.refresh_positions()
-
-                # Get updated account info after trade
-                updated_account = self.get_alpaca_account()
-                updated_balance = float(updated_account.get('equity', account_balance))
+            if result.get('status') not in UNFILLED_RESULT_STATUSES:
+                # Broker positions are refreshed on the next position read (for IB broker)
+                self._positions_dirty = True
+
+                updated_balance = self._post_trade_equity(account_balance, result, current_qty, current_price, -1)
                 updated_session_pnl = updated_balance - self.initial_balance
 
-                if not getattr(self, 'quiet_mode', False):
+                if not self.quiet_mode:
                     print(f" POSITION CLOSED - {current_qty} {symbol} at market")
                     print(f"     Exit Price: ${result.get('avg_fill_price', current_price):.5f}")
                     print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
                 else:
                     print(f"\n[CLOSE] {current_qty} {symbol} @ ${result.get('avg_fill_price', current_price):.5f}")
 
-                self.trades.append({
-                    'timestamp': timestamp,
-                    'action': 'close_position',
-                    'price': current_price,
-                    'quantity': current_qty,
-                    'order_details': result
-                })
+                self._record_trade(timestamp, 'close_position', current_price, current_qty, result)
 
                 # DEBUG: Backend trade logging
-                print(f"\n[BACKEND] Trade recorded:")
-                print(f"  Timestamp: {timestamp}")
-                print(f"  Action: close_position")
-                print(f"  Price: ${current_price:.2f}")
-                print(f"  Fill Price: ${result.get('avg_fill_price', 0):.2f}")
-                print(f"  Quantity: {current_qty}")
+                self._log_recorded_trade(timestamp, 'close_position', current_price, current_qty, result)
             else:
                 print(f" CLOSE POSITION FAILED - {result.get('error', 'Unknown error')}")
 
-    def _process_long_short_signals(self, buy_signal, sell_signal, current_qty, alpaca_position,
+    def _process_long_short_signals(self, buy_signal, sell_signal, current_qty, alpaca_position, account_info,
                                   symbol, quantity, current_price, timestamp):
         """Process signals for long/short trading mode - uses persistent limit orders"""
-        # Get account info for display
-        account_info = self.get_alpaca_account()
-        account_balance = float(account_info.get('equity', 0))
-        unrealized_pnl = float(alpaca_position.get('unrealized_pl', 0))
-        session_pnl = account_balance - self.initial_balance
-
-        # Check for pending orders for this symbol
-        has_pending_buy = any(
-            order['symbol'] == symbol and order['side'] == 'buy'
-            for order in self.pending_orders.values()
-        )
-        has_pending_sell = any(
-            order['symbol'] == symbol and order['side'] == 'sell'
-            for order in self.pending_orders.values()
-        )
-
         # Cancel any conflicting pending orders for opposite direction
         if buy_signal:
             self._cancel_pending_sell_orders(symbol)
+            side = 'buy'
         elif sell_signal:
             self._cancel_pending_buy_orders(symbol)
+            side = 'sell'
+        else:
+            return
 
-        # Process buy signal
-        if buy_signal:
-            if current_qty < 0:  # Currently short, close short position first then open long
-                print(f"\n🔵 BUY SIGNAL - Closing short position for {symbol} at ${current_price:.2f}")
-                print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
+        sign = (current_qty > 0) - (current_qty < 0)
+        self._long_short_handlers[(sign, side)](current_qty, alpaca_position, account_info,
+                                                symbol, quantity, current_price, timestamp)
 
-                result = self.close_position(symbol, current_price=current_price)
-                if result.get('status') != 'failed':
-                    print(f" SHORT POSITION CLOSED - {abs(current_qty)} {symbol}")
-                    self.trades.append({
-                        'timestamp': timestamp,
-                        'action': 'close_short',
-                        'price': current_price,
-                        'quantity': abs(current_qty),
-                        'order_details': result
-                    })
+    def _account_summary(self, account_info: dict, alpaca_position: PositionSnapshot):
+        """Account balance, unrealized P&L and session P&L for signal messages"""
+        account_balance = float(account_info.get('equity', 0))
+        return account_balance, alpaca_position.unrealized_pl, account_balance - self.initial_balance
 
-                    # DEBUG: Backend trade logging
-                    print(f"\n[BACKEND] Trade recorded:")
-                    print(f"  Timestamp: {timestamp}")
-                    print(f"  Action: close_short")
-                    print(f"  Price: ${current_price:.2f}")
-                    print(f"  Quantity: {abs(current_qty)}")
-
-                    # Now open long position after closing short
-                    print(f"\n🔵 BUY SIGNAL - Opening long position for {symbol} at ${current_price:.2f}")
-
-                    if self._confirm_trade_execution('BUY', symbol, quantity, current_price, alpaca_position):
-                        long_result = self.execute_buy_order(symbol, quantity, order_type="market", current_price=current_price)
-                        if long_result.get('status') not in ['failed', 'pending']:
-                            # Force position refresh
-                            if hasattr(self.broker_interface, 'refresh_positions'):
-                                self.broker_interface.refresh_positions()
-
-                            updated_account = self.get_alpaca_account()
-                            updated_balance = float(updated_account.get('equity', account_balance))
-                            updated_session_pnl = updated_balance - self.initial_balance
-
-                            print(f" BUY ORDER FILLED - {quantity} {symbol} at market")
-                            print(f"     Fill Price: ${long_result.get('avg_fill_price', current_price):.5f}")
-                            print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
-
-                            self.trades.append({
-                                'timestamp': timestamp,
-                                'action': 'buy_long',
-                                'price': current_price,
-                                'quantity': quantity,
-                                'order_details': long_result
-                            })
-
-                            # DEBUG: Backend trade logging
-                            print(f"\n[BACKEND] Trade recorded:")
-                            print(f"  Timestamp: {timestamp}")
-                            print(f"  Action: buy_long")
-                            print(f"  Price: ${current_price:.2f}")
-                            print(f"  Fill Price: ${long_result.get('avg_fill_price', 0):.2f}")
-                            print(f"  Quantity: {quantity}")
-                        else:
-                            print(f" BUY ORDER FAILED - {long_result.get('error', 'Unknown error')}")
-                    else:
-                        print(f" BUY SIGNAL REJECTED - Invalid conditions")
+    def _reverse_short_to_long(self, current_qty, alpaca_position, account_info,
+                               symbol, quantity, current_price, timestamp):
+        """Buy signal while short: close the short, then open a long"""
+        account_balance, unrealized_pnl, session_pnl = self._account_summary(account_info, alpaca_position)
 
-            elif current_qty == 0 and not has_pending_buy:  # No position and no pending buy, open long
-                print(f"\n🔵 BUY SIGNAL - Attempting to buy {quantity} {symbol} at market price")
-                print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
+        print(f"\n{self._glyphs['buy']} BUY SIGNAL - Closing short position for {symbol} at ${current_price:.2f}")
+        print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
 
-                if self._confirm_trade_execution('BUY', symbol, quantity, current_price, alpaca_position):
-                    result = self.execute_buy_order(symbol, quantity, order_type="market", current_price=current_price)
-                    if result.get('status') not in ['failed', 'pending']:
-                        # Force position refresh for IB broker
-                        if hasattr(self.broker_interface, 'refresh_positions'):
-                            self.broker_interface.refresh_positions()
+        result = self.close_position(symbol, current_price=current_price)
+        if result.get('status') != 'failed':
+            print(f" SHORT POSITION CLOSED - {abs(current_qty)} {symbol}")
+            self._record_trade(timestamp, 'close_short', current_price, abs(current_qty), result)
 
-                        updated_account = self.get_alpaca_account()
-                        updated_balance = float(updated_account.get('equity', account_balance))
-                        updated_session_pnl = updated_balance - self.initial_balance
+            # DEBUG: Backend trade logging
+            self._log_recorded_trade(timestamp, 'close_short', current_price, abs(current_qty), result)
 
-                        print(f" BUY ORDER FILLED - {quantity} {symbol} at market")
-                        print(f"     Fill Price: ${result.get('avg_fill_price', current_price):.5f}")
-                        print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
+            # Now open long position after closing short
+            print(f"\n{self._glyphs['buy']} BUY SIGNAL - Opening long position for {symbol} at ${current_price:.2f}")
 
-                        self.trades.append({
-                            'timestamp': timestamp,
-                            'action': 'buy_long',
-                            'price': current_price,
-                            'quantity': quantity,
-                            'order_details': result
-                        })
-
-                        # DEBUG: Backend trade logging
-                        print(f"\n[BACKEND] Trade recorded:")
-                        print(f"  Timestamp: {timestamp}")
-                        print(f"  Action: buy_long")
-                        print(f"  Price: ${current_price:.2f}")
-                        print(f"  Fill Price: ${result.get('avg_fill_price', 0):.2f}")
-                        print(f"  Quantity: {quantity}")
-                    else:
-                        print(f" BUY ORDER FAILED - {result.get('error', 'Unknown error')}")
+            if self._confirm_trade_execution('BUY', symbol, quantity, current_price, alpaca_position):
+                long_result = self.execute_buy_order(symbol, quantity, order_type="market", current_price=current_price)
+                if long_result.get('status') not in UNFILLED_RESULT_STATUSES:
+                    # Broker positions are refreshed on the next position read (for IB broker)
+                    self._positions_dirty = True
+
+                    updated_balance = self._post_trade_equity(account_balance, long_result, quantity, current_price, 1)
+                    updated_session_pnl = updated_balance - self.initial_balance
+
+                    print(f" BUY ORDER FILLED - {quantity} {symbol} at market")
+                    print(f"     Fill Price: ${long_result.get('avg_fill_price', current_price):.5f}")
+                    print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
+
+                    self._record_trade(timestamp, 'buy_long', current_price, quantity, long_result)
+
+                    # DEBUG: Backend trade logging
+                    self._log_recorded_trade(timestamp, 'buy_long', current_price, quantity, long_result)
                 else:
-                    print(f" BUY SIGNAL REJECTED - Insufficient funds or invalid conditions")
+                    print(f" BUY ORDER FAILED - {long_result.get('error', 'Unknown error')}")
+            else:
+                print(f" BUY SIGNAL REJECTED - Invalid conditions")
+
+    def _open_long_from_flat(self, current_qty, alpaca_position, account_info,
+                             symbol, quantity, current_price, timestamp):
+        """Buy signal while flat: open a long unless a buy order is already pending"""
+        if self._has_pending_order(symbol, 'buy'):
+            # Already have pending buy order
+            print(f"\n{self._glyphs['buy']} BUY SIGNAL IGNORED - Already have pending BUY order for {symbol}")
+            print(f"     Cannot place multiple buy orders (position limit enforced)")
+            return
 
-            elif current_qty > 0:
-                # Already long - ignore signal
-                print(f"\n🔵 BUY SIGNAL IGNORED - Already have LONG position: {current_qty} {symbol}")
-                print(f"     Cannot add to existing position (position limit enforced)")
+        account_balance, unrealized_pnl, session_pnl = self._account_summary(account_info, alpaca_position)
 
-            elif has_pending_buy:
-                # Already have pending buy order
-                print(f"\n🔵 BUY SIGNAL IGNORED - Already have pending BUY order for {symbol}")
-                print(f"     Cannot place multiple buy orders (position limit enforced)")
+        print(f"\n{self._glyphs['buy']} BUY SIGNAL - Attempting to buy {quantity} {symbol} at market price")
+        print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
 
-        # Process sell signal
-        elif sell_signal:
-            if current_qty > 0:  # Currently long, close long position first then open short
-                print(f"\n🔴 SELL SIGNAL - Closing long position for {symbol} at ${current_price:.2f}")
-                print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
+        if self._confirm_trade_execution('BUY', symbol, quantity, current_price, alpaca_position, account_info):
+            result = self.execute_buy_order(symbol, quantity, order_type="market", current_price=current_price)
+            if result.get('status') not in UNFILLED_RESULT_STATUSES:
+                # Broker positions are refreshed on the next position read (for IB broker)
+                self._positions_dirty = True
 
-                result = self.close_position(symbol, current_price=current_price)
-                if result.get('status') != 'failed':
-                    print(f" LONG POSITION CLOSED - {current_qty} {symbol}")
-                    self.trades.append({
-                        'timestamp': timestamp,
-                        'action': 'close_long',
-                        'price': current_price,
-                        'quantity': current_qty,
-                        'order_details': result
-                    })
+                updated_balance = self._post_trade_equity(account_balance, result, quantity, current_price, 1)
+                updated_session_pnl = updated_balance - self.initial_balance
 
-                    # DEBUG: Backend trade logging
-                    print(f"\n[BACKEND] Trade recorded:")
-                    print(f"  Timestamp: {timestamp}")
-                    print(f"  Action: close_long")
-                    print(f"  Price: ${current_price:.2f}")
-                    print(f"  Quantity: {current_qty}")
-
-                    # Now open short position after closing long
-                    print(f"\n🔴 SELL SIGNAL - Opening short position for {symbol} at ${current_price:.2f}")
-
-                    if self._confirm_trade_execution('SELL', symbol, quantity, current_price, alpaca_position):
-                        short_result = self.execute_sell_order(symbol, quantity, order_type="market", current_price=current_price)
-                        if short_result.get('status') not in ['failed', 'pending']:
-                            # Force position refresh
-                            if hasattr(self.broker_interface, 'refresh_positions'):
-                                self.broker_interface.refresh_positions()
-
-                            updated_account = self.get_alpaca_account()
-                            updated_balance = float(updated_account.get('equity', account_balance))
-                            updated_session_pnl = updated_balance - self.initial_balance
-
-                            print(f" SHORT ORDER FILLED - {quantity} {symbol} at market")
-                            print(f"     Fill Price: ${short_result.get('avg_fill_price', current_price):.5f}")
-                            print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
-
-                            self.trades.append({
-                                'timestamp': timestamp,
-                                'action': 'sell_short',
-                                'price': current_price,
-                                'quantity': quantity,
-                                'order_details': short_result
-                            })
-
-                            # DEBUG: Backend trade logging
-                            print(f"\n[BACKEND] Trade recorded:")
-                            print(f"  Timestamp: {timestamp}")
-                            print(f"  Action: sell_short")
-                            print(f"  Price: ${current_price:.2f}")
-                            print(f"  Fill Price: ${short_result.get('avg_fill_price', 0):.2f}")
-                            print(f"  Quantity: {quantity}")
-                        else:
-                            print(f" SHORT ORDER FAILED - {short_result.get('error', 'Unknown error')}")
-                    else:
-                        print(f" SHORT SIGNAL REJECTED - Invalid conditions")
+                print(f" BUY ORDER FILLED - {quantity} {symbol} at market")
+                print(f"     Fill Price: ${result.get('avg_fill_price', current_price):.5f}")
+                print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
 
-            elif current_qty == 0 and not has_pending_sell:  # No position and no pending sell, open short
-                print(f"\n🔴 SELL SIGNAL - Attempting to short {quantity} {symbol} at market price")
-                print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
+                self._record_trade(timestamp, 'buy_long', current_price, quantity, result)
 
-                if self._confirm_trade_execution('SELL', symbol, quantity, current_price, alpaca_position):
-                    result = self.execute_sell_order(symbol, quantity, order_type="market", current_price=current_price)
-                    if result.get('status') not in ['failed', 'pending']:
-                        # Force position refresh for IB broker
-                        if hasattr(self.broker_interface, 'refresh_positions'):
-                            self.broker_interface.refresh_positions()
+                # DEBUG: Backend trade logging
+                self._log_recorded_trade(timestamp, 'buy_long', current_price, quantity, result)
+            else:
+                print(f" BUY ORDER FAILED - {result.get('error', 'Unknown error')}")
+        else:
+            print(f" BUY SIGNAL REJECTED - Insufficient funds or invalid conditions")
 
-                        updated_account = self.get_alpaca_account()
-                        updated_balance = float(updated_account.get('equity', account_balance))
-                        updated_session_pnl = updated_balance - self.initial_balance
+    def _ignore_buy_while_long(self, current_qty, alpaca_position, account_info,
+                               symbol, quantity, current_price, timestamp):
+        """Buy signal while already long: nothing to do"""
+        print(f"\n{self._glyphs['buy']} BUY SIGNAL IGNORED - Already have LONG position: {current_qty} {symbol}")
+        print(f"     Cannot add to existing position (position limit enforced)")
 
-                        print(f" SHORT ORDER FILLED - {quantity} {symbol} at market")
-                        print(f"     Fill Price: ${result.get('avg_fill_price', current_price):.5f}")
-                        print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
+    def _reverse_long_to_short(self, current_qty, alpaca_position, account_info,
+                               symbol, quantity, current_price, timestamp):
+        """Sell signal while long: close the long, then open a short"""
+        account_balance, unrealized_pnl, session_pnl = self._account_summary(account_info, alpaca_position)
 
-                        self.trades.append({
-                            'timestamp': timestamp,
-                            'action': 'sell_short',
-                            'price': current_price,
-                            'quantity': quantity,
-                            'order_details': result
-                        })
-
-                        # DEBUG: Backend trade logging
-                        print(f"\n[BACKEND] Trade recorded:")
-                        print(f"  Timestamp: {timestamp}")
-                        print(f"  Action: sell_short")
-                        print(f"  Price: ${current_price:.2f}")
-                        print(f"  Fill Price: ${result.get('avg_fill_price', 0):.2f}")
-                        print(f"  Quantity: {quantity}")
-                    else:
-                        print(f" SHORT ORDER FAILED - {result.get('error', 'Unknown error')}")
+        print(f"\n{self._glyphs['sell']} SELL SIGNAL - Closing long position for {symbol} at ${current_price:.2f}")
+        print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
+
+        result = self.close_position(symbol, current_price=current_price)
+        if result.get('status') != 'failed':
+            print(f" LONG POSITION CLOSED - {current_qty} {symbol}")
+            self._record_trade(timestamp, 'close_long', current_price, current_qty, result)
+
+            # DEBUG: Backend trade logging
+            self._log_recorded_trade(timestamp, 'close_long', current_price, current_qty, result)
+
+            # Now open short position after closing long
+            print(f"\n{self._glyphs['sell']} SELL SIGNAL - Opening short position for {symbol} at ${current_price:.2f}")
+
+            if self._confirm_trade_execution('SELL', symbol, quantity, current_price, alpaca_position):
+                short_result = self.execute_sell_order(symbol, quantity, order_type="market", current_price=current_price)
+                if short_result.get('status') not in UNFILLED_RESULT_STATUSES:
+                    # Broker positions are refreshed on the next position read (for IB broker)
+                    self._positions_dirty = True
+
+                    updated_balance = self._post_trade_equity(account_balance, short_result, quantity, current_price, -1)
+                    updated_session_pnl = updated_balance - self.initial_balance
+
+                    print(f" SHORT ORDER FILLED - {quantity} {symbol} at market")
+                    print(f"     Fill Price: ${short_result.get('avg_fill_price', current_price):.5f}")
+                    print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
+
+                    self._record_trade(timestamp, 'sell_short', current_price, quantity, short_result)
+
+                    # DEBUG: Backend trade logging
+                    self._log_recorded_trade(timestamp, 'sell_short', current_price, quantity, short_result)
                 else:
-                    print(f" SELL SIGNAL REJECTED - Invalid conditions")
+                    print(f" SHORT ORDER FAILED - {short_result.get('error', 'Unknown error')}")
+            else:
+                print(f" SHORT SIGNAL REJECTED - Invalid conditions")
+
+    def _open_short_from_flat(self, current_qty, alpaca_position, account_info,
+                              symbol, quantity, current_price, timestamp):
+        """Sell signal while flat: open a short unless a sell order is already pending"""
+        if self._has_pending_order(symbol, 'sell'):
+            # Already have pending sell order
+            print(f"\n{self._glyphs['sell']} SELL SIGNAL IGNORED - Already have pending SELL order for {symbol}")
+            print(f"     Cannot place multiple sell orders (position limit enforced)")
+            return
 
-            elif current_qty < 0:
-                # Already short - ignore signal
-                print(f"\n🔴 SELL SIGNAL IGNORED - Already have SHORT position: {abs(current_qty)} {symbol}")
-                print(f"     Cannot add to existing position (position limit enforced)")
+        account_balance, unrealized_pnl, session_pnl = self._account_summary(account_info, alpaca_position)
+
+        print(f"\n{self._glyphs['sell']} SELL SIGNAL - Attempting to short {quantity} {symbol} at market price")
+        print(f"     Account: ${account_balance:.2f} | Unrealized: ${unrealized_pnl:.2f} | Session: ${session_pnl:.2f}")
+
+        if self._confirm_trade_execution('SELL', symbol, quantity, current_price, alpaca_position, account_info):
+            result = self.execute_sell_order(symbol, quantity, order_type="market", current_price=current_price)
+            if result.get('status') not in UNFILLED_RESULT_STATUSES:
+                # Broker positions are refreshed on the next position read (for IB broker)
+                self._positions_dirty = True
+
+                updated_balance = self._post_trade_equity(account_balance, result, quantity, current_price, -1)
+                updated_session_pnl = updated_balance - self.initial_balance
 
-            elif has_pending_sell:
-                # Already have pending sell order
-                print(f"\n🔴 SELL SIGNAL IGNORED - Already have pending SELL order for {symbol}")
-                print(f"     Cannot place multiple sell orders (position limit enforced)")
+                print(f" SHORT ORDER FILLED - {quantity} {symbol} at market")
+                print(f"     Fill Price: ${result.get('avg_fill_price', current_price):.5f}")
+                print(f"     Updated Account: ${updated_balance:.2f} | Session P&L: ${updated_session_pnl:.2f}")
+
+                self._record_trade(timestamp, 'sell_short', current_price, quantity, result)
+
+                # DEBUG: Backend trade logging
+                self._log_recorded_trade(timestamp, 'sell_short', current_price, quantity, result)
+            else:
+                print(f" SHORT ORDER FAILED - {result.get('error', 'Unknown error')}")
+        else:
+            print(f" SELL SIGNAL REJECTED - Invalid conditions")
+
+    def _ignore_sell_while_short(self, current_qty, alpaca_position, account_info,
+                                 symbol, quantity, current_price, timestamp):
+        """Sell signal while already short: nothing to do"""
+        print(f"\n{self._glyphs['sell']} SELL SIGNAL IGNORED - Already have SHORT position: {abs(current_qty)} {symbol}")
+        print(f"     Cannot add to existing position (position limit enforced)")
 
     def run_strategy(self,
                     strategy,
@@ -770,7 +1215,8 @@ class LiveTradingEngine:
                     sleep_interval: int = 60,
                     max_iterations: Optional[int] = None,
                     quiet_mode: bool = False,
-                    chart_callback: Optional[Callable] = None):
+                    chart_callback: Optional[Callable] = None,
+                    display_every: int = 1):
         """
         Run strategy continuously
 
@@ -782,227 +1228,339 @@ class LiveTradingEngine:
             max_iterations: Maximum iterations (None for infinite)
             quiet_mode: If True, minimize terminal output
             chart_callback: Optional callback to update chart
+            display_every: Show trading stats every Nth iteration
+        """
+        steps = self._run_steps(strategy, symbol, quantity, sleep_interval, max_iterations,
+                                quiet_mode, chart_callback, display_every)
+        try:
+            step = next(steps)
+            while True:
+                try:
+                    result = step()
+                except Exception as e:
+                    step = steps.throw(e)
+                    continue
+                step = steps.send(result)
+        except StopIteration:
+            pass
+        except KeyboardInterrupt:
+            if not quiet_mode:
+                self.logger.info("Received keyboard interrupt, stopping...")
+            self.stop()
+        finally:
+            steps.close()
+
+    async def run_strategy_async(self,
+                                 strategy,
+                                 symbol: str,
+                                 quantity: float = 1,
+                                 sleep_interval: int = 60,
+                                 max_iterations: Optional[int] = None,
+                                 quiet_mode: bool = False,
+                                 chart_callback: Optional[Callable] = None,
+                                 display_every: int = 1):
+        """
+        Run strategy continuously as a coroutine, so several engines can share one event loop
+
+        Each iteration's data fetch and broker calls run in a worker thread; e.g.
+        asyncio.run(asyncio.gather(*(engine.run_strategy_async(...) for engine in engines)))
+
+        Args:
+            strategy: Strategy instance
+            symbol: Trading symbol
+            quantity: Position size
+            sleep_interval: Seconds between iterations
+            max_iterations: Maximum iterations (None for infinite)
+            quiet_mode: If True, minimize terminal output
+            chart_callback: Optional callback to update chart (called on the event loop thread)
+            display_every: Show trading stats every Nth iteration
+        """
+        steps = self._run_steps(strategy, symbol, quantity, sleep_interval, max_iterations,
+                                quiet_mode, chart_callback, display_every)
+        try:
+            step = next(steps)
+            while True:
+                try:
+                    result = await asyncio.to_thread(step)
+                except Exception as e:
+                    step = steps.throw(e)
+                    continue
+                step = steps.send(result)
+        except StopIteration:
+            pass
+        except asyncio.CancelledError:
+            self.stop()
+            raise
+        finally:
+            steps.close()
+
+    def _run_steps(self, strategy, symbol: str, quantity: float, sleep_interval: float,
+                   max_iterations: Optional[int], quiet_mode: bool, chart_callback: Optional[Callable],
+                   display_every: int):
+        """Run loop shared by run_strategy and run_strategy_async
+
+        Yields each blocking call (an iteration, or the wait before the next one) for the caller
+        to run on its own thread or a worker thread, and receives the call's result back.
         """
         self.running = True
+        self._attach_order_listener()  # Re-registers after a previous stop()
+        self._queue_logging()
         iteration = 0
         self.quiet_mode = quiet_mode
+        self.display_every = max(1, display_every)
+        self._wake.clear()
+        # Iterations start on a fixed cadence measured from here, not sleep_interval after the last one ended
+        next_tick = time.monotonic() + sleep_interval
 
         if not quiet_mode:
             self.logger.info(f"Starting live trading for {strategy.name} on {symbol}")
 
+        while self.running:
+            # Check max iterations
+            if max_iterations and iteration >= max_iterations:
+                if not quiet_mode:
+                    self.logger.info("Max iterations reached, stopping...")
+                break
+
+            try:
+                yield partial(self._run_iteration, strategy, symbol, quantity, iteration + 1)
+
+                # Update chart if callback provided
+                if chart_callback:
+                    chart_callback()
+
+            except Exception as e:
+                if not quiet_mode:
+                    self.logger.error(f"Error in iteration {iteration + 1}: {e}")
+
+            iteration += 1
+
+            # Wait until the next tick's deadline (returns early if stop() is called)
+            if self.running:
+                delay, next_tick = self._schedule_next_tick(next_tick, sleep_interval, iteration)
+                if (yield partial(self._wake.wait, delay)):
+                    # Woken early by pushed data: the next poll is due a full interval from now
+                    next_tick = time.monotonic() + sleep_interval
+                self._wake.clear()
+
+    def _schedule_next_tick(self, next_tick: float, sleep_interval: float, iteration: int):
+        """Seconds to wait for the tick deadline and the deadline after it, resyncing after an overrun"""
+        now = time.monotonic()
+        delay = next_tick - now
+        if delay <= 0:
+            # Work took longer than the interval: start the next tick now rather than bursting to catch up
+            if sleep_interval > 0 and not self.quiet_mode:
+                self.logger.warning(f"Tick overrun: iteration {iteration} finished {-delay:.2f}s past its deadline")
+            return 0.0, now + sleep_interval
+        return delay, next_tick + sleep_interval
+
+    def _run_iteration(self, strategy, symbol: str, quantity: float, iteration: int):
+        """Fetch the latest bars, act on them and show the iteration's stats"""
+        # When this tick is known to read the broker (stats render, or pending orders to check),
+        # refresh the account and position on the worker pool while the bars download; idle ticks
+        # stay free of REST calls and a tick that turns out to signal fetches on demand
+        display = iteration % self.display_every == 0
+        prefetch = None
+        if display or self.pending_orders:
+            prefetch = self._rest_pool.submit(self._prefetch_broker_state, symbol)
         try:
-            while self.running:
-                # Check max iterations
-                if max_iterations and iteration >= max_iterations:
-                    if not quiet_mode:
-                        self.logger.info("Max iterations reached, stopping...")
-                    break
-
-                try:
-                    # Get latest data
-                    df = self.data_provider.get_live_data(symbol)
-
-                    # Process signals
-                    self.process_signals(df, strategy, symbol, quantity)
-
-                    # Display trading stats
-                    if quiet_mode:
-                        self._display_quiet_stats(iteration + 1, symbol)
-                    else:
-                        self._display_trading_stats(iteration + 1, symbol)
+            df = self.data_provider.get_live_data(symbol)
+        finally:
+            if prefetch is not None:
+                prefetch.result()
+        self.process_signals(df, strategy, symbol, quantity)
 
-                    # Update chart if callback provided
-                    if chart_callback:
-                        chart_callback()
+        if not display:
+            return
 
-                except Exception as e:
-                    if not quiet_mode:
-                        self.logger.error(f"Error in iteration {iteration + 1}: {e}")
+        if self.quiet_mode:
+            # Show the price from the bars just processed instead of fetching them again
+            current_price = df['Close'].iat[-1] if len(df) > 0 else 0
+            self._display_quiet_stats(iteration, symbol, current_price)
+        else:
+            self._display_trading_stats(iteration, symbol)
 
-                iteration += 1
+    def notify_new_data(self, *_):
+        """Wake the run loop to process new data now instead of at its next interval
 
-                # Wait before next iteration
-                if self.running:
-                    time.sleep(sleep_interval)
+        Streaming data sources can push into the engine by taking this as their update
+        callback; sleep_interval then only bounds how long the loop waits when nothing arrives.
+        """
+        self._wake.set()
 
-        except KeyboardInterrupt:
-            if not quiet_mode:
-                self.logger.info("Received keyboard interrupt, stopping...")
-            self.stop()
-    
     def stop(self):
         """Stop the trading engine"""
         self.running = False
+        self._wake.set()
+        self._detach_order_listener()
         self.logger.info("Live trading engine stopped")
+        self._unqueue_logging()
     
     def get_trade_history(self) -> pd.DataFrame:
         """Get trade history as DataFrame with enhanced formatting"""
-        if not self.trades:
+        if self._trade_n == 0:
             return pd.DataFrame()
 
-        # Convert trades to enhanced format
-        enhanced_trades = []
-
-        for i, trade in enumerate(self.trades):
-            # Get account info for this trade
-            account_info = self.get_alpaca_account()
-            current_balance = float(account_info.get('equity', self.initial_balance))
-
-            # Map action to consistent format
-            action_map = {
-                'buy_long': 'BUY',
-                'sell_short': 'SELL_SHORT',
-                'close_position': 'CLOSE',
-                'close_long': 'CLOSE_LONG',
-                'close_short': 'CLOSE_SHORT'
-            }
-
-            # Determine position from action
-            position_map = {
-                'buy_long': 1,
-                'sell_short': -1,
-                'close_position': 0,
-                'close_long': 0,
-                'close_short': 0
-            }
+        n = self._trade_n
+        cols = self._trade_cols
+        actions = pd.Series(cols['action'][:n].tolist())
+        prices = cols['price'][:n].copy()
+        quantities = cols['quantity'][:n].copy()
 
-            # Calculate total account worth and profit
-            total_account_worth = current_balance
-            total_profit = current_balance - self.initial_balance
-
-            # Determine if this is a closing trade and calculate realized P&L
-            last_trade_realized = 0
-            trade_result = "OPEN"
-
-            if trade['action'] in ['close_position', 'close_long', 'close_short']:
-                # For closing trades, try to calculate profit from the previous opening trade
-                if i > 0:
-                    prev_trade = self.trades[i-1]
-                    if prev_trade['action'] in ['buy_long', 'sell_short']:
-                        if prev_trade['action'] == 'buy_long':
-                            last_trade_realized = (trade['price'] - prev_trade['price']) * trade['quantity']
-                        else:  # sell_short
-                            last_trade_realized = (prev_trade['price'] - trade['price']) * trade['quantity']
-                        trade_result = "Win" if last_trade_realized > 0 else "Loss"
-
-            enhanced_trade = {
-                'Time': trade['timestamp'],
-                'Price': trade['price'],
-                'Position': position_map.get(trade['action'], 0),
-                'Index': i,
-                'Action': action_map.get(trade['action'], trade['action'].upper()),
-                'Shares': trade['quantity'],
-                'Cost': trade['quantity'] * trade['price'] if trade['action'] in ['buy_long'] else None,
-                'Proceeds': trade['quantity'] * trade['price'] if trade['action'] in ['sell_short', 'close_position', 'close_long'] else None,
-                'Last_Trade_Realized': last_trade_realized,
-                'Balance': current_balance,
-                'Total_Account_Worth': total_account_worth,
-                'Total_Profit': total_profit,
-                'Trade_Result': trade_result
-            }
+        # Account info is the same for every row, so fetch it once for the whole history
+        account_info = self.get_alpaca_account()
+        current_balance = float(account_info.get('equity', self.initial_balance))
+
+        # Map action to consistent format
+        action_map = {
+            'buy_long': 'BUY',
+            'sell_short': 'SELL_SHORT',
+            'close_position': 'CLOSE',
+            'close_long': 'CLOSE_LONG',
+            'close_short': 'CLOSE_SHORT'
+        }
 
-            enhanced_trades.append(enhanced_trade)
+        # Determine position from action
+        position_map = {
+            'buy_long': 1,
+            'sell_short': -1,
+            'close_position': 0,
+            'close_long': 0,
+            'close_short': 0
+        }
 
-        df = pd.DataFrame(enhanced_trades)
+        # A closing trade realizes P&L against the trade right before it when that one opened a position
+        prev_actions = actions.shift(1)
+        prev_prices = np.concatenate(([np.nan], prices[:-1]))
+        closing = actions.isin(CLOSE_ACTIONS).to_numpy()
+        after_long = closing & (prev_actions == 'buy_long').to_numpy()
+        after_short = closing & (prev_actions == 'sell_short').to_numpy()
+        last_trade_realized = np.where(after_long, (prices - prev_prices) * quantities,
+                                       np.where(after_short, (prev_prices - prices) * quantities, 0.0))
+        trade_result = np.where(after_long | after_short,
+                                np.where(last_trade_realized > 0, "Win", "Loss"), "OPEN")
+
+        notional = prices * quantities
+        df = pd.DataFrame({
+            'Time': cols['timestamp'][:n].tolist(),
+            'Price': prices,
+            'Position': actions.map(position_map).fillna(0).astype(np.int64),
+            'Index': np.arange(n),
+            'Action': actions.map(action_map).fillna(actions.str.upper()),
+            'Shares': quantities,
+            'Cost': np.where(actions == 'buy_long', notional, np.nan),
+            'Proceeds': np.where(actions.isin(CLOSE_LONG_ACTIONS | {'sell_short'}), notional, np.nan),
+            'Last_Trade_Realized': last_trade_realized,
+            'Balance': current_balance,
+            'Total_Account_Worth': current_balance,
+            'Total_Profit': current_balance - self.initial_balance,
+            'Trade_Result': trade_result
+        })
 
         # Add lowercase aliases for backward compatibility with chart code
-        if len(df) > 0:
-            df['timestamp'] = df['Time']
-            df['action'] = df['Action'].str.lower().replace({
-                'buy': 'buy_long',
-                'sell_short': 'sell_short',
-                'close': 'close_position',
-                'close_long': 'close_long',
-                'close_short': 'close_short'
-            })
-            df['price'] = df['Price']
-            df['quantity'] = df['Shares']
+        df['timestamp'] = df['Time']
+        df['action'] = df['Action'].str.lower().replace({
+            'buy': 'buy_long',
+            'sell_short': 'sell_short',
+            'close': 'close_position',
+            'close_long': 'close_long',
+            'close_short': 'close_short'
+        })
+        df['price'] = df['Price']
+        df['quantity'] = df['Shares']
 
         return df
     
+    def _pair_trades(self):
+        """Match each closing trade to the open it closes: (entry indices, exit indices, profits)"""
+        n = self._trade_n
+        cols = self._trade_cols
+        actions = cols['action'][:n]
+        prices = cols['price'][:n]
+        quantities = cols['quantity'][:n]
+        idx = np.arange(n)
+
+        def pair(opens, closes):
+            # A close pairs with the latest open of its side, unless an earlier close already consumed it
+            last_open = np.maximum.accumulate(np.where(opens, idx, -1))
+            last_close = np.maximum.accumulate(np.where(closes, idx, -1))
+            prev_close = np.concatenate(([-1], last_close[:-1]))
+            return closes & (last_open > prev_close), last_open
+
+        long_exits, long_entry = pair(actions == 'buy_long', np.isin(actions, list(CLOSE_LONG_ACTIONS)))
+        short_exits, short_entry = pair(actions == 'sell_short', actions == 'close_short')
+
+        exit_idx = np.flatnonzero(long_exits | short_exits)
+        is_long = long_exits[exit_idx]
+        entry_idx = np.where(is_long, long_entry[exit_idx], short_entry[exit_idx])
+        # Long trades profit from a rise, short trades from a fall
+        direction = np.where(is_long, 1.0, -1.0)
+        profits = direction * (prices[exit_idx] - prices[entry_idx]) * quantities[exit_idx]
+        return entry_idx, exit_idx, profits
+
     def _get_completed_trades(self) -> List[Dict]:
-        """Parse trade history to identify completed trade pairs (buy/close cycles)"""
-        trade_df = self.get_trade_history()
-        if len(trade_df) == 0:
+        """Parse the trade log to identify completed trade pairs (buy/close cycles)"""
+        if self._trade_n == 0:
             return []
 
-        completed_trades = []
-        open_positions = {}  # Track open positions by symbol
-
-        for _, trade in trade_df.iterrows():
-            action = trade['action']
-
-            # Opening position
-            if action in ['buy_long', 'sell_short']:
-                # If we already have an open position for this symbol, something's wrong
-                # but we'll treat it as a new position
-                open_positions[action] = trade
-
-            # Closing position
-            elif action in ['close_position', 'close_long', 'close_short']:
-                # Find the matching open position
-                entry_trade = None
-                if action in ['close_position', 'close_long'] and 'buy_long' in open_positions:
-                    entry_trade = open_positions.pop('buy_long')
-                elif action == 'close_short' and 'sell_short' in open_positions:
-                    entry_trade = open_positions.pop('sell_short')
-
-                if entry_trade is not None:
-                    # Calculate profit/loss
-                    entry_price = entry_trade['price']
-                    exit_price = trade['price']
-
-                    if entry_trade['action'] == 'buy_long':
-                        profit = (exit_price - entry_price) * trade['quantity']
-                    else:  # sell_short
-                        profit = (entry_price - exit_price) * trade['quantity']
-
-                    completed_trades.append({
-                        'entry_time': entry_trade['timestamp'],
-                        'exit_time': trade['timestamp'],
-                        'entry_price': entry_price,
-                        'exit_price': exit_price,
-                        'quantity': trade['quantity'],
-                        'profit': profit,
-                        'action_type': entry_trade['action'],
-                        'is_win': profit > 0
-                    })
-
-        return completed_trades
-
-    def get_performance_summary(self) -> Dict[str, Any]:
-        """Get performance summary using Alpaca account data and completed trades"""
-        # Get account info from Alpaca
-        account_info = self.get_alpaca_account()
+        cols = self._trade_cols
+        entry_idx, exit_idx, profits = self._pair_trades()
+        return [
+            {
+                'entry_time': cols['timestamp'][entry],
+                'exit_time': cols['timestamp'][exit],
+                'entry_price': float(cols['price'][entry]),
+                'exit_price': float(cols['price'][exit]),
+                'quantity': float(cols['quantity'][exit]),
+                'profit': profit,
+                'action_type': cols['action'][entry],
+                'is_win': profit > 0
+            }
+            for entry, exit, profit in zip(entry_idx.tolist(), exit_idx.tolist(), profits.tolist())
+        ]
 
-        current_balance = float(account_info.get('equity', self.current_balance))
-        portfolio_value = float(account_info.get('portfolio_value', current_balance))
+    def _get_trade_stats(self) -> Dict[str, Any]:
+        """Win/loss statistics from completed trades, recomputed only when a trade is recorded"""
+        cache = self._perf_cache
+        if cache['n_trades'] == self._trade_n:
+            return cache['value']
 
-        # Get completed trades (buy/close pairs)
-        completed_trades = self._get_completed_trades()
+        # Profits of completed trades (buy/close pairs)
+        profits = self._pair_trades()[2]
 
-        if len(completed_trades) == 0:
-            return {
+        if len(profits) == 0:
+            stats = {
                 'total_trades': 0,
                 'profitable_trades': 0,
                 'losing_trades': 0,
-                'win_rate': 0,
-                'current_balance': current_balance,
-                'portfolio_value': portfolio_value,
-                'total_return': current_balance - self.initial_balance,
-                'percent_return': (current_balance / self.initial_balance - 1) * 100,
-                'current_position': self.position
+                'win_rate': 0
+            }
+        else:
+            # Calculate trade performance from completed trades
+            profitable_trades = int(np.count_nonzero(profits > 0))
+            losing_trades = len(profits) - profitable_trades
+
+            stats = {
+                'total_trades': len(profits),
+                'profitable_trades': profitable_trades,
+                'losing_trades': losing_trades,
+                'win_rate': profitable_trades / len(profits) * 100
             }
 
-        # Calculate trade performance from completed trades
-        profitable_trades = sum(1 for trade in completed_trades if trade['is_win'])
-        losing_trades = len(completed_trades) - profitable_trades
+        cache['n_trades'] = self._trade_n
+        cache['value'] = stats
+        return stats
+
+    def get_performance_summary(self) -> Dict[str, Any]:
+        """Get performance summary using Alpaca account data and completed trades"""
+        # Get account info from Alpaca
+        account_info = self.get_alpaca_account()
+
+        current_balance = float(account_info.get('equity', self.current_balance))
+        portfolio_value = float(account_info.get('portfolio_value', current_balance))
 
         return {
-            'total_trades': len(completed_trades),
-            'profitable_trades': profitable_trades,
-            'losing_trades': losing_trades,
-            'win_rate': profitable_trades / len(completed_trades) * 100 if len(completed_trades) > 0 else 0,
+            **self._get_trade_stats(),
             'current_balance': current_balance,
             'portfolio_value': portfolio_value,
             'total_return': current_balance - self.initial_balance,
@@ -1016,10 +1574,10 @@ class LiveTradingEngine:
         alpaca_position = self.get_alpaca_position(symbol)
 
         # Get unrealized P&L directly from Alpaca
-        unrealized_pnl = float(alpaca_position['unrealized_pl'])
-        current_qty = float(alpaca_position['qty'])
-        avg_entry_price = float(alpaca_position['avg_entry_price'])
-        market_value = float(alpaca_position['market_value'])
+        unrealized_pnl = alpaca_position.unrealized_pl
+        current_qty = alpaca_position.qty
+        avg_entry_price = alpaca_position.avg_entry_price
+        market_value = alpaca_position.market_value
 
         # Format position status using Alpaca data
         position_status = "FLAT"
@@ -1028,46 +1586,45 @@ class LiveTradingEngine:
         elif current_qty < 0:
             position_status = f"SHORT {abs(current_qty)} @ ${avg_entry_price:.2f}"
 
-        # Print stats
-        print("\n" + "=" * 60)
-        print(f" LIVE TRADING STATS - Iteration {iteration} (Alpaca Data)")
-        print("=" * 60)
-        print(f"Symbol: {symbol}")
-        print(f"Position: {position_status}")
-        print(f"Market Value: ${market_value:.2f}")
-        print(f"Total Trades: {performance['total_trades']}")
-        print(f"Win Rate: {performance['win_rate']:.1f}%")
-        print(f"Account Equity: ${performance['current_balance']:.2f}")
-        print(f"Portfolio Value: ${performance['portfolio_value']:.2f}")
-        print(f"Total Return: ${performance['total_return']:.2f}")
-        print(f"Unrealized P&L: ${unrealized_pnl:.2f}")
-        print(f"Total P&L: ${performance['total_return'] + unrealized_pnl:.2f}")
-        print(f"Percent Return: {performance['percent_return']:.2f}%")
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 60)
-
-    def _display_quiet_stats(self, iteration: int, symbol: str):
+        # Print stats as a single write
+        sys.stdout.write(STATS_TEMPLATE.format_map({
+            'separator': STATS_SEPARATOR,
+            'iteration': iteration,
+            'symbol': symbol,
+            'position_status': position_status,
+            'market_value': market_value,
+            'total_trades': performance['total_trades'],
+            'win_rate': performance['win_rate'],
+            'current_balance': performance['current_balance'],
+            'portfolio_value': performance['portfolio_value'],
+            'total_return': performance['total_return'],
+            'unrealized_pnl': unrealized_pnl,
+            'total_pnl': performance['total_return'] + unrealized_pnl,
+            'percent_return': performance['percent_return'],
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+        }))
+        sys.stdout.flush()
+
+    def _display_quiet_stats(self, iteration: int, symbol: str, current_price: Optional[float] = None):
         """Display minimal trading statistics for quiet mode"""
-        if iteration % 1 != 0:  # Display every iteration
-            return
-
         alpaca_position = self.get_alpaca_position(symbol)
         performance = self.get_performance_summary()
 
-        # Get current price
-        try:
-            df = self.data_provider.get_live_data(symbol)
-            if len(df) > 0:
-                current_price = df.iloc[-1]['Close']
-            else:
+        # Get current price, unless the caller already has it
+        if current_price is None:
+            try:
+                df = self.data_provider.get_live_data(symbol)
+                if len(df) > 0:
+                    current_price = df['Close'].iat[-1]
+                else:
+                    current_price = 0
+            except:
                 current_price = 0
-        except:
-            current_price = 0
 
         # Get position info
-        current_qty = float(alpaca_position['qty'])
-        unrealized_pnl = float(alpaca_position['unrealized_pl'])
-        avg_entry_price = float(alpaca_position['avg_entry_price'])
+        current_qty = alpaca_position.qty
+        unrealized_pnl = alpaca_position.unrealized_pl
+        avg_entry_price = alpaca_position.avg_entry_price
 
         # Position status
         position_status = "FLAT"
@@ -1076,30 +1633,27 @@ class LiveTradingEngine:
         elif current_qty < 0:
             position_status = f"SHORT {abs(current_qty):,.0f}"
 
-        # Color codes for terminal
-        GREEN = '\033[92m'
-        RED = '\033[91m'
-        YELLOW = '\033[93m'
-        CYAN = '\033[96m'
-        RESET = '\033[0m'
-        BOLD = '\033[1m'
-
         # Determine P&L color
-        total_pnl = unrealized_pnl + performance['total_return']
-        pnl_color = GREEN if total_pnl >= 0 else RED
-        unrealized_color = GREEN if unrealized_pnl >= 0 else RED
-        realized_color = GREEN if performance['total_return'] >= 0 else RED
+        realized_pnl = performance['total_return']
+        total_pnl = unrealized_pnl + realized_pnl
+        green, red = ANSI['green'], ANSI['red']
 
         # Single line output
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"\r{CYAN}[{timestamp}]{RESET} "
-              f"{BOLD}{symbol}{RESET} "
-              f"Price: {YELLOW}{current_price:.5f}{RESET} | "
-              f"Position: {BOLD}{position_status}{RESET} "
-              f"@ {avg_entry_price:.5f} | "
-              f"Unrealized: {unrealized_color}{unrealized_pnl:+.2f}{RESET} | "
-              f"Realized: {realized_color}{performance['total_return']:+.2f}{RESET} | "
-              f"Total: {pnl_color}{BOLD}{total_pnl:+.2f}{RESET} | "
-              f"Trades: {performance['total_trades']} "
-              f"(W:{performance['profitable_trades']} L:{performance['losing_trades']})",
-              end='', flush=True)
\ No newline at end of file
+        sys.stdout.write(QUIET_STATUS_TEMPLATE.format_map({
+            **ANSI,
+            'timestamp': time.strftime('%H:%M:%S'),
+            'symbol': symbol,
+            'current_price': current_price,
+            'position_status': position_status,
+            'avg_entry_price': avg_entry_price,
+            'unrealized_color': green if unrealized_pnl >= 0 else red,
+            'unrealized_pnl': unrealized_pnl,
+            'realized_color': green if realized_pnl >= 0 else red,
+            'realized_pnl': realized_pnl,
+            'pnl_color': green if total_pnl >= 0 else red,
+            'total_pnl': total_pnl,
+            'total_trades': performance['total_trades'],
+            'profitable_trades': performance['profitable_trades'],
+            'losing_trades': performance['losing_trades']
+        }))
+        sys.stdout.flush()
\ No newline at end of file
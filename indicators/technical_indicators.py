@@ -1,8 +1,16 @@
 import pandas as pd
 import numpy as np
 
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None  # Optional: without it the rolling indicators use pandas' rolling engine
+
 def sma(data, period):
     """Simple Moving Average"""
+    if bn is not None:
+        values = bn.move_mean(data.to_numpy(dtype=np.float64), period, min_count=period)
+        return pd.Series(values, index=data.index, name=data.name)
     return data.rolling(window=period).mean()
 
 def ema(data, period):
@@ -11,8 +19,14 @@ def ema(data, period):
 
 def bollinger_bands(data, period=20, std_dev=2):
     """Bollinger Bands indicator"""
-    sma_values = sma(data, period)
-    rolling_std = data.rolling(window=period).std()
+    if bn is not None:
+        values = data.to_numpy(dtype=np.float64)
+        sma_values = pd.Series(bn.move_mean(values, period, min_count=period), index=data.index, name=data.name)
+        rolling_std = pd.Series(bn.move_std(values, period, min_count=period, ddof=1), index=data.index, name=data.name)
+    else:
+        window = data.rolling(window=period)
+        sma_values = window.mean()
+        rolling_std = window.std()
 
     upper_band = sma_values + (rolling_std * std_dev)
     lower_band = sma_values - (rolling_std * std_dev)
@@ -26,8 +40,8 @@ def bollinger_bands(data, period=20, std_dev=2):
 def rsi(data, period=14):
     """Relative Strength Index"""
     delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    gain = sma(delta.where(delta > 0, 0), period)
+    loss = sma(-delta.where(delta < 0, 0), period)
 
     rs = gain / loss
     rsi_values = 100 - (100 / (1 + rs))
@@ -49,14 +63,18 @@ def macd(data, fast_period=12, slow_period=26, signal_period=9):
         'histogram': histogram
     }
 
+# Category order of the codes returned by detect_candlestick_patterns
+CANDLESTICK_PATTERNS = ['none', 'hammer', 'shooting_star']
+
 def detect_candlestick_patterns(open_prices, high_prices, low_prices, close_prices):
     """Detect basic candlestick patterns"""
-    patterns = pd.Series(index=close_prices.index, dtype=str)
+    open_values = open_prices.to_numpy(dtype=np.float64)
+    close_values = close_prices.to_numpy(dtype=np.float64)
 
     # Calculate body and shadows
-    body = abs(close_prices - open_prices)
-    upper_shadow = high_prices - np.maximum(open_prices, close_prices)
-    lower_shadow = np.minimum(open_prices, close_prices) - low_prices
+    body = np.abs(close_values - open_values)
+    upper_shadow = high_prices.to_numpy(dtype=np.float64) - np.maximum(open_values, close_values)
+    lower_shadow = np.minimum(open_values, close_values) - low_prices.to_numpy(dtype=np.float64)
 
     # Hammer pattern (small body, long lower shadow, small upper shadow)
     hammer_condition = (
@@ -64,7 +82,6 @@ def detect_candlestick_patterns(open_prices, high_prices, low_prices, close_pric
         (lower_shadow > (body * 2)) &
         (upper_shadow < (body * 0.5))
     )
-    patterns[hammer_condition] = 'hammer'
 
     # Shooting star (small body, long upper shadow, small lower shadow)
     shooting_star_condition = (
@@ -72,6 +89,7 @@ def detect_candlestick_patterns(open_prices, high_prices, low_prices, close_pric
         (upper_shadow > (body * 2)) &
         (lower_shadow < (body * 0.5))
     )
-    patterns[shooting_star_condition] = 'shooting_star'
 
-    return patterns.fillna('none')
\ No newline at end of file
+    # One int8 code per bar instead of object-dtype string writes; shooting star wins ties as before
+    codes = np.select([shooting_star_condition, hammer_condition], [2, 1], default=0).astype(np.int8)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=CANDLESTICK_PATTERNS), index=close_prices.index)
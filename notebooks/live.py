@@ -2,38 +2,67 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import os
+import json
 import alpaca_trade_api as tradeapi
+from alpaca_trade_api.rest import APIError
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 from polygon import BaseClient
 import matplotlib.pyplot as  plt
 from datetime import datetime, timedelta
 import time
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads  # orjson is optional; the stdlib parser reads the same bytes
+
 ALPACA_API_KEY = os.getenv('ALPACA_API_KEY')
 ALPACA_SECRET_KEY = os.getenv('ALPACA_SECRET_KEY')
 ALPACA_BASE_URL = 'https://paper-api.alpaca.markets/'
 
+BB_WINDOW = 20
+# Minutes of history fetched per band bar; crypto minutes with no trades have no bar
+LATEST_BARS_LOOKBACK = 3
+# Seconds past the minute boundary to wait for the closed bar to reach the API
+BAR_CLOSE_SKEW = 0.2
+
+# One pooled session so the bot's per-minute polls reuse the Polygon TLS connection
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
 trade_api = tradeapi.REST(ALPACA_API_KEY, ALPACA_SECRET_KEY, ALPACA_BASE_URL, api_version='v2')
 
 def buy(symbol='ETHUSD', qty=0.01):
-    trade_api.submit_order(
-        symbol=symbol,
-        qty=qty,
-        side='buy',
-        type='market',
-        time_in_force='gtc'
-    )
+    # Returns None when Alpaca rejects the order (e.g. shorting crypto); other failures still raise
+    try:
+        trade_api.submit_order(
+            symbol=symbol,
+            qty=qty,
+            side='buy',
+            type='market',
+            time_in_force='gtc'
+        )
+    except APIError as e:
+        print(f"Buy order for {qty} {symbol} rejected: {e}")
+        return None
     return(f"Bought {qty} shares of {symbol}")
 
 def sell(symbol='ETHUSD', qty=0.01):
-    trade_api.submit_order(
-        symbol=symbol,
-        qty=qty,
-        side='sell',
-        type='market',
-        time_in_force='gtc'
-    )
+    # Returns None when Alpaca rejects the order (e.g. shorting crypto); other failures still raise
+    try:
+        trade_api.submit_order(
+            symbol=symbol,
+            qty=qty,
+            side='sell',
+            type='market',
+            time_in_force='gtc'
+        )
+    except APIError as e:
+        print(f"Sell order for {qty} {symbol} rejected: {e}")
+        return None
     return(f"Sold {qty} shares of {symbol}")
 
 def getData(ticker='X:BTCUSD', timespan='minute', limit=50000):
@@ -43,17 +72,37 @@ def getData(ticker='X:BTCUSD', timespan='minute', limit=50000):
     to_date = to_date.strftime('%Y-%m-%d') 
     from_date = from_date.strftime('%Y-%m-%d')
     url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/{timespan}/{from_date}/{to_date}?adjusted=true&sort=asc&limit={limit}&apiKey={api_key}"
-    response = requests.get(url)
-    data = response.json()
-    df = pd.DataFrame(data['results'])
-    df['timestamp'] = pd.to_datetime(df['t'], unit='ms')
-    df.rename(columns={'o': 'Open', 'h': 'High', 'l': 'Low', 'c': 'Close', 'v': 'Volume'}, inplace=True)
-    df.drop(columns=['vw', 'n', 't'], inplace=True)
-    return df
+    response = _session.get(url)
+    data = _loads(response.content)
+    return _barsToFrame(data['results'])
+
+def getLatestBars(ticker='X:BTCUSD', window=20, timespan='minute'):
+    # Only the last `window` closes feed the newest band, so skip the full-day pull
+    api_key = os.getenv('POLYGON_API_KEY')
+    to_ms = int(time.time() * 1000)
+    from_ms = to_ms - window * LATEST_BARS_LOOKBACK * 60_000
+    url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/{timespan}/{from_ms}/{to_ms}?adjusted=true&sort=asc&limit={window * LATEST_BARS_LOOKBACK}&apiKey={api_key}"
+    response = _session.get(url)
+    results = _loads(response.content).get('results', [])
+    if len(results) < window:
+        return None
+    return _barsToFrame(results)
+
+def _barsToFrame(results):
+    # Build each column straight from the bar dicts instead of inferring a row-wise frame and dropping the extras
+    return pd.DataFrame({
+        'Volume': [bar['v'] for bar in results],
+        'Open': [bar['o'] for bar in results],
+        'Close': [bar['c'] for bar in results],
+        'High': [bar['h'] for bar in results],
+        'Low': [bar['l'] for bar in results],
+        'timestamp': pd.to_datetime([bar['t'] for bar in results], unit='ms'),
+    })
 
 def getSignals(df, window=20, num_std=2):
-    df['SMA'] = df['Close'].rolling(window).mean()
-    df['STD'] = df['Close'].rolling(window).std()
+    rolling = df['Close'].rolling(window)
+    df['SMA'] = rolling.mean()
+    df['STD'] = rolling.std()
 
     df['Upper Band'] = df['SMA'] + (df['STD'] * num_std)
     df['Lower Band'] = df['SMA'] - (df['STD'] * num_std)
@@ -63,39 +112,56 @@ def getSignals(df, window=20, num_std=2):
 
     return df
 
+def sleepUntilNextBar():
+    # Wake just after the next minute bar closes instead of a fixed 60s after this one
+    next_tick = (int(time.time()) // 60 + 1) * 60 + BAR_CLOSE_SKEW
+    time.sleep(max(0, next_tick - time.time()))
+
 def run_trading_bot():
     position = 0
+    last_seen_ts = None
     while(1):
-        data = getData()
-        signals = getSignals(data)
+        data = getLatestBars(window=BB_WINDOW)
+        if data is None:
+            data = getData()
+        if data['timestamp'].iloc[-1] == last_seen_ts:
+            # No new bar since the last check, so the signals cannot have changed
+            sleepUntilNextBar()
+            continue
+        last_seen_ts = data['timestamp'].iloc[-1]
+        signals = getSignals(data, window=BB_WINDOW)
         sellAction = signals.iloc[-1]['Sell Signal']
         buyAction = signals.iloc[-1]['Buy Signal']
         print()
         if position == 0:
             if(buyAction == True):
-                buy()
-                position = 1
+                if buy():
+                    position = 1
             elif(sellAction == True):
-                sell()
-                position = -1
+                if sell():
+                    position = -1
             else:
                 print ("No affects on positions / Current Position: " + str(position))
         elif position == 1:
             if(sellAction == True):
-                sell()
-                sell()
-                position = -1
+                # Close the long, then open the short; track each leg only once Alpaca accepts it
+                if sell():
+                    position = 0
+                    if sell():
+                        position = -1
             else:
                 print ("No affects on positions / Current Position: " + str(position))
         elif position == -1:
             if(buyAction == True):
-                buy()
-                buy()
-                position = 1
+                # Cover the short, then open the long
+                if buy():
+                    position = 0
+                    if buy():
+                        position = 1
             else:
                 print ("No affects on positions / Current Position: " + str(position))
     
-        time.sleep(60)
+        sleepUntilNextBar()
 
 if __name__ == "__main__":
     sell()
\ No newline at end of file
@@ -10,6 +10,9 @@ class BollingerBandsStrategy:
     Sell when price touches upper band (overbought)
     """
 
+    # Rolling bands: signals only depend on the last window bars (live engine may splice)
+    window_bounded_signals = True
+
     def __init__(self, window: int = 20, num_std: float = 2, **kwargs):
         self.name = "Bollinger Bands"
         self.params = {
@@ -9,6 +9,9 @@ class MeanReversionExtremeStrategy:
     More aggressive, waits for full reversal
     """
 
+    # Rolling SMA/STD bands: signals only depend on the last window bars (live engine may splice)
+    window_bounded_signals = True
+
     def __init__(self, window: int = 20, num_std: float = 2.0, **kwargs):
         self.name = "Mean Reversion"
         self.params = {"window": window, "num_std": num_std, **kwargs}
@@ -8,6 +8,9 @@ class MovingAverageStrategy:
     Moving average crossover strategy
     Based on the movingAverage.ipynb notebook
     """
+
+    # SMA crossovers: signals only depend on the last long_window bars (live engine may splice)
+    window_bounded_signals = True
     
     def __init__(self, short_window: int = 1, medium_window: int = 5, long_window: int = 25, **kwargs):
         self.name = "Moving Average"
@@ -10,6 +10,9 @@ class RSIStrategy:
     Sell when RSI is overbought (> overbought_threshold)
     """
 
+    # RSI here is built on rolling means, so only the last window bars matter (live engine may splice)
+    window_bounded_signals = True
+
     def __init__(self, window: int = 14, oversold_threshold: float = 30, overbought_threshold: float = 70, **kwargs):
         self.name = "RSI"
         self.params = {
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from engines.live_trading_engine import LiveTradingEngine
+from indicators.technical_indicators import ema
+from strategies.moving_average import MovingAverageStrategy
+
+
+class EMACrossStrategy:
+    """EMA crossover: every signal depends on the whole price history"""
+
+    name = "EMA Cross"
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        fast = ema(df['Close'], 12)
+        slow = ema(df['Close'], 26)
+        above = fast > slow
+        df['Buy Signal'] = above & ~above.shift(1, fill_value=False)
+        df['Sell Signal'] = ~above & above.shift(1, fill_value=False)
+        return df
+
+    def get_signal_names(self):
+        return {'buy': 'Buy Signal', 'sell': 'Sell Signal'}
+
+    def get_required_lookback(self) -> int:
+        return 26
+
+
+def _bars(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2025-01-01', periods=n, freq='min'),
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1.0
+    })
+
+
+def _assert_incremental_matches_full(strategy, n: int = 400, start: int = 120):
+    engine = LiveTradingEngine(data_provider=None)
+    bars = _bars(n)
+    for end in range(start, n + 1):
+        df = bars.iloc[:end]
+        incremental = engine._generate_signals(df, strategy)
+        full = strategy.generate_signals(df)
+        for column in ('Buy Signal', 'Sell Signal'):
+            assert incremental[column].tolist() == full[column].tolist(), f"{column} differs at bar {end}"
+
+
+def test_incremental_signals_match_full_for_ema_strategy():
+    _assert_incremental_matches_full(EMACrossStrategy())
+
+
+def test_incremental_signals_match_full_for_window_bounded_strategy():
+    _assert_incremental_matches_full(MovingAverageStrategy())